@@ -10,19 +10,27 @@ Maintains 1-minute and 5-minute candles without full DataFrame overhead.
 """
 
 import datetime
-import pytz
-from collections import deque
-from threading import Lock
+from contextlib import contextmanager
+from threading import Condition, Event
+from zoneinfo import ZoneInfo
 import logging
 
+import numpy as np
+
 from config import MAX_1M_CANDLES, MAX_5M_CANDLES
 
 logger = logging.getLogger(__name__)
 
+# Module-level timezone singletons (zoneinfo caches transition data and is
+# faster than pytz's localize/astimezone dance on repeated conversions)
+NY_TZ = ZoneInfo('America/New_York')
+
 
 class Candle:
     """Represents a single OHLCV candle."""
-    
+
+    __slots__ = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
     def __init__(self, timestamp, open_price, high, low, close, volume=0):
         self.timestamp = timestamp
         self.open = open_price
@@ -30,10 +38,11 @@ class Candle:
         self.low = low
         self.close = close
         self.volume = volume
-    
+
     def __repr__(self):
-        return f"Candle({self.timestamp}, O:{self.open:.2f}, H:{self.high:.2f}, L:{self.low:.2f}, C:{self.close:.2f})"
-    
+        return "Candle(%s, O:%g, H:%g, L:%g, C:%g)" % (
+            self.timestamp, self.open, self.high, self.low, self.close)
+
     def to_dict(self):
         """Convert to dictionary format."""
         return {
@@ -46,198 +55,567 @@ class Candle:
         }
 
 
+class _RWLock:
+    """
+    Minimal readers-preferred reader-writer lock. Multiple reader threads
+    (strategy/monitor) proceed concurrently; the writer side is only taken
+    for structural mutations (full-buffer shift, clear), which are rare.
+    """
+
+    def __init__(self):
+        self._cond = Condition()
+        self._readers = 0
+
+    @contextmanager
+    def read_locked(self):
+        with self._cond:
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write_locked(self):
+        with self._cond:
+            while self._readers > 0:
+                self._cond.wait()
+            yield
+
+
+class _CandleArray:
+    """
+    Struct-of-arrays candle storage: six parallel numpy arrays instead of a
+    deque of Candle objects. Keeps OHLCV scans cache-friendly and avoids one
+    heap allocation per closed candle; Candle objects are only materialized
+    when handed back to callers.
+
+    Rows live in a fixed-capacity ring: ``head`` counts total appends and
+    the physical slot is ``head % capacity``, so a full buffer overwrites
+    the oldest row in place instead of shifting the arrays. Appends are
+    single-producer: the row is written first and ``head`` is bumped last,
+    so a concurrent reader either sees the fully written row or does not
+    see it at all. Once the ring has wrapped, appends take the write lock
+    because they overwrite the oldest row that readers may be indexing.
+    """
+
+    def __init__(self, capacity, rwlock):
+        # Round up to a power of two so ring indexing is a mask (single
+        # AND) rather than an integer modulo
+        cap = 1
+        while cap < capacity:
+            cap <<= 1
+        self.capacity = cap
+        self._mask = cap - 1
+        self._rw = rwlock
+        self.ts = np.zeros(cap, dtype=np.int64)  # epoch seconds
+        self.open = np.zeros(cap, dtype=np.float64)
+        self.high = np.zeros(cap, dtype=np.float64)
+        self.low = np.zeros(cap, dtype=np.float64)
+        self.close = np.zeros(cap, dtype=np.float64)
+        self.volume = np.zeros(cap, dtype=np.int64)
+        self.head = 0  # total rows ever appended
+
+    @property
+    def count(self):
+        """Number of rows currently stored."""
+        return self.head if self.head < self.capacity else self.capacity
+
+    def _phys(self, i):
+        """Physical slot of logical row i (0 = oldest stored)."""
+        return (self.head - self.count + i) & self._mask
+
+    def _write_row(self, ts, open_price, high, low, close, volume):
+        i = self.head & self._mask
+        self.ts[i] = ts
+        self.open[i] = open_price
+        self.high[i] = high
+        self.low[i] = low
+        self.close[i] = close
+        self.volume[i] = volume
+        self.head += 1
+
+    def append(self, ts, open_price, high, low, close, volume):
+        """Append one candle row, overwriting the oldest row when full."""
+        if self.head < self.capacity:
+            self._write_row(ts, open_price, high, low, close, volume)
+        else:
+            # Overwrites the oldest row, which readers may be indexing
+            with self._rw.write_locked():
+                self._write_row(ts, open_price, high, low, close, volume)
+
+    def make_candle(self, i):
+        """Materialize logical row i (0 = oldest stored) as a Candle."""
+        p = self._phys(i)
+        return Candle(
+            timestamp=datetime.datetime.fromtimestamp(int(self.ts[p]), tz=NY_TZ),
+            open_price=float(self.open[p]),
+            high=float(self.high[p]),
+            low=float(self.low[p]),
+            close=float(self.close[p]),
+            volume=int(self.volume[p])
+        )
+
+    def last_n(self, n):
+        """Materialize the last n rows as Candle objects (oldest to newest)."""
+        count = self.count
+        if n > count:
+            n = count
+        return [self.make_candle(i) for i in range(count - n, count)]
+
+    def ordered_ts(self):
+        """Timestamps of all stored rows in logical order (copy)."""
+        count = self.count
+        start = (self.head - count) & self._mask
+        return self.ts[(start + np.arange(count)) & self._mask]
+
+    def clear(self):
+        self.head = 0
+
+
 class CandleBuffer:
     """
     Thread-safe rolling buffer for 1-minute and 5-minute candles.
     Aggregates ticks into 1m candles and builds 5m candles from 1m data.
     """
-    
+
+    # Slotted layout: the tick kernel touches a dozen attributes per tick,
+    # and slot access skips the instance-dict lookup
+    __slots__ = (
+        '_rw', '_1m', '_5m', 'current_minute',
+        '_cur_open', '_cur_high', '_cur_low', '_cur_close', '_cur_volume',
+        '_current_minute_epoch',
+        '_cur_5m_bucket', '_cur_5m_open', '_cur_5m_high', '_cur_5m_low',
+        '_cur_5m_close', '_cur_5m_volume', '_cur_5m_minutes',
+        '_5m_snapshots', '_5m_active_idx', '_5m_version', '_or_cache',
+        'new_candle_event', 'on_new_5m', 'ny_tz',
+    )
+
     def __init__(self):
-        self.candles_1m = deque(maxlen=MAX_1M_CANDLES)
-        self.candles_5m = deque(maxlen=MAX_5M_CANDLES)
-        self.lock = Lock()
-        
-        # Current 1-minute candle being built
-        self.current_candle = None
+        self._rw = _RWLock()
+        self._1m = _CandleArray(MAX_1M_CANDLES, self._rw)
+        self._5m = _CandleArray(MAX_5M_CANDLES, self._rw)
+
+        # Current 1-minute candle being built, held as plain scalar
+        # attributes (no per-tick dict hashing). _current_minute_epoch is
+        # None until the first tick arrives.
         self.current_minute = None
-        
+        self._cur_open = 0.0
+        self._cur_high = 0.0
+        self._cur_low = 0.0
+        self._cur_close = 0.0
+        self._cur_volume = 0
+
+        # Integer minute bucket of the current candle (epoch_seconds // 60).
+        # Lets add_tick detect minute rollover with an int compare instead of
+        # converting every tick to NY time.
+        self._current_minute_epoch = None
+
+        # Running 5-minute accumulators, maintained tick-by-tick so closing
+        # a 5m period needs no re-scan of the 1m window. _cur_5m_minutes
+        # counts 1m candles started in the bucket and is only advanced when
+        # the bucket began on a 5-minute boundary (slot 0), mirroring the
+        # old consecutive-window check.
+        self._cur_5m_bucket = None
+        self._cur_5m_open = 0.0
+        self._cur_5m_high = 0.0
+        self._cur_5m_low = 0.0
+        self._cur_5m_close = 0.0
+        self._cur_5m_volume = 0
+        self._cur_5m_minutes = 0
+
+        # Active/standby snapshots of the 5m series, each a pair of
+        # (candles tuple, epoch-seconds array). The writer rebuilds the
+        # standby slot on each 5m close and flips the index; readers just
+        # load the active snapshot with no locking (5m data only changes
+        # every five minutes, but is read many times per second).
+        self._5m_snapshots = [((), None), ((), None)]
+        self._5m_active_idx = 0
+
+        # Version counter bumped on every 5m publish; lets repeated reads
+        # (the session state machine polls the OR window every loop) reuse
+        # their last result until the data actually changes
+        self._5m_version = 0
+        self._or_cache = None
+
+        # Signaled whenever a 1m candle closes, so consumers can block on
+        # candle completion instead of polling every second
+        self.new_candle_event = Event()
+
+        # Optional hook called as on_new_5m(ts_epoch, high, low) right
+        # after a 5m candle is published; lets the session state machine
+        # maintain its OR range incrementally instead of rescanning
+        self.on_new_5m = None
+
         # Cache timezone object (optimization: avoid recreating on every tick)
-        self.ny_tz = pytz.timezone('America/New_York')
-        
+        self.ny_tz = NY_TZ
+
         logger.info("CandleBuffer initialized")
-    
+
     def add_tick(self, timestamp, bid, ask):
         """
         Add a tick and aggregate into 1-minute candles.
-        
+
         Args:
-            timestamp (datetime): Tick timestamp (UTC)
+            timestamp (float): Tick timestamp as epoch seconds (UTC)
             bid (float): Bid price
             ask (float): Ask price
+
+        Lock-free on the hot path: ticks arrive from the single streaming
+        thread, and closed candles are published by writing the array row
+        before bumping the count (see _CandleArray), so readers never observe
+        a half-written candle.
+        """
+        # Use mid price (multiply, not divide - float division is the
+        # slower instruction and this line runs on every tick)
+        mid = (bid + ask) * 0.5
+
+        # Floor to minute as a plain integer (epoch_seconds // 60);
+        # the NY-aligned datetime is only built on minute rollover below.
+        minute_epoch = int(timestamp) // 60
+
+        # Fast path: tick falls in the current minute (~99% of ticks).
+        # A single int compare, then in-place float updates - no datetime
+        # work at all.
+        current = self._current_minute_epoch
+        if current is not None and minute_epoch <= current:
+            # Branch on the uncommon side only: most ticks move neither
+            # extreme, so both comparisons usually fall through
+            if mid > self._cur_high:
+                self._cur_high = mid
+            elif mid < self._cur_low:
+                self._cur_low = mid
+            self._cur_close = mid
+            self._cur_volume += 1
+
+            # Update the running 5m accumulator in the same pass
+            if mid > self._cur_5m_high:
+                self._cur_5m_high = mid
+            elif mid < self._cur_5m_low:
+                self._cur_5m_low = mid
+            self._cur_5m_close = mid
+            self._cur_5m_volume += 1
+            return
+
+        # Minute rollover (or first tick): close previous candle if exists
+        if current is not None:
+            self._close_1m_candle()
+
+        # Start new candle (materialize NY timestamp once per minute)
+        candle_minute = datetime.datetime.fromtimestamp(
+            minute_epoch * 60, tz=self.ny_tz)
+        self._current_minute_epoch = minute_epoch
+        self.current_minute = candle_minute
+        self._cur_open = mid
+        self._cur_high = mid
+        self._cur_low = mid
+        self._cur_close = mid
+        self._cur_volume = 1
+
+        # Roll the 5m accumulator
+        bucket = minute_epoch // 5
+        if bucket != self._cur_5m_bucket:
+            self._cur_5m_bucket = bucket
+            self._cur_5m_open = mid
+            self._cur_5m_high = mid
+            self._cur_5m_low = mid
+            self._cur_5m_close = mid
+            self._cur_5m_volume = 1
+            # Only a bucket entered at slot 0 can produce a full 5m candle
+            self._cur_5m_minutes = 1 if minute_epoch % 5 == 0 else 0
+        else:
+            if self._cur_5m_minutes > 0:
+                self._cur_5m_minutes += 1
+            if mid > self._cur_5m_high:
+                self._cur_5m_high = mid
+            elif mid < self._cur_5m_low:
+                self._cur_5m_low = mid
+            self._cur_5m_close = mid
+            self._cur_5m_volume += 1
+
+    def add_ticks(self, timestamps, bids, asks):
         """
-        with self.lock:
-            # Use mid price
-            mid = (bid + ask) / 2.0
-            
-            # Convert to NY timezone for candle alignment
-            ny_time = timestamp.astimezone(self.ny_tz)
-            
-            # Round down to minute
-            candle_minute = ny_time.replace(second=0, microsecond=0)
-            
-            # Check if we're starting a new candle
-            if self.current_minute is None or candle_minute > self.current_minute:
-                # Close previous candle if exists
-                if self.current_candle is not None:
-                    self._close_1m_candle()
-                
-                # Start new candle
-                self.current_minute = candle_minute
-                self.current_candle = {
-                    'timestamp': candle_minute,
-                    'open': mid,
-                    'high': mid,
-                    'low': mid,
-                    'close': mid,
-                    'volume': 1
-                }
-            else:
-                # Update current candle
-                self.current_candle['high'] = max(self.current_candle['high'], mid)
-                self.current_candle['low'] = min(self.current_candle['low'], mid)
-                self.current_candle['close'] = mid
-                self.current_candle['volume'] += 1
-    
+        Batch-ingest a run of consecutive ticks.
+
+        Args:
+            timestamps: sequence or array of epoch seconds (UTC)
+            bids: sequence/array of bid prices
+            asks: sequence/array of ask prices
+
+        Vectorizes the mid computation and minute bucketing over the whole
+        batch, then applies one aggregate update per minute segment instead
+        of paying per-tick Python overhead.
+        """
+        bids = np.asarray(bids, dtype=np.float64)
+        asks = np.asarray(asks, dtype=np.float64)
+        if len(bids) == 0:
+            return
+        mids = (bids + asks) * 0.5
+
+        epochs = np.asarray(timestamps).astype(np.int64, copy=False)
+        minute_epochs = epochs // 60
+
+        # One segment per distinct minute in the batch
+        boundaries = np.flatnonzero(np.diff(minute_epochs)) + 1
+        start = 0
+        for end in [*boundaries, len(mids)]:
+            self._ingest_segment(int(minute_epochs[start]), mids[start:end])
+            start = end
+
+    def _ingest_segment(self, minute_epoch, mids):
+        """Apply a same-minute run of mid prices as one aggregate update."""
+        seg_high = float(mids.max())
+        seg_low = float(mids.min())
+        seg_close = float(mids[-1])
+        seg_volume = len(mids)
+
+        current = self._current_minute_epoch
+        if current is not None and minute_epoch <= current:
+            if seg_high > self._cur_high:
+                self._cur_high = seg_high
+            if seg_low < self._cur_low:
+                self._cur_low = seg_low
+            self._cur_close = seg_close
+            self._cur_volume += seg_volume
+
+            if seg_high > self._cur_5m_high:
+                self._cur_5m_high = seg_high
+            if seg_low < self._cur_5m_low:
+                self._cur_5m_low = seg_low
+            self._cur_5m_close = seg_close
+            self._cur_5m_volume += seg_volume
+            return
+
+        # Minute rollover (or first segment): close previous candle
+        if current is not None:
+            self._close_1m_candle()
+
+        self._current_minute_epoch = minute_epoch
+        self.current_minute = datetime.datetime.fromtimestamp(
+            minute_epoch * 60, tz=self.ny_tz)
+        self._cur_open = float(mids[0])
+        self._cur_high = seg_high
+        self._cur_low = seg_low
+        self._cur_close = seg_close
+        self._cur_volume = seg_volume
+
+        bucket = minute_epoch // 5
+        if bucket != self._cur_5m_bucket:
+            self._cur_5m_bucket = bucket
+            self._cur_5m_open = self._cur_open
+            self._cur_5m_high = seg_high
+            self._cur_5m_low = seg_low
+            self._cur_5m_close = seg_close
+            self._cur_5m_volume = seg_volume
+            # Only a bucket entered at slot 0 can produce a full 5m candle
+            self._cur_5m_minutes = 1 if minute_epoch % 5 == 0 else 0
+        else:
+            if self._cur_5m_minutes > 0:
+                self._cur_5m_minutes += 1
+            if seg_high > self._cur_5m_high:
+                self._cur_5m_high = seg_high
+            if seg_low < self._cur_5m_low:
+                self._cur_5m_low = seg_low
+            self._cur_5m_close = seg_close
+            self._cur_5m_volume += seg_volume
+
     def _close_1m_candle(self):
         """Close the current 1-minute candle and add to buffer."""
-        if self.current_candle is None:
+        if self._current_minute_epoch is None:
             return
-        
-        candle = Candle(
-            timestamp=self.current_candle['timestamp'],
-            open_price=self.current_candle['open'],
-            high=self.current_candle['high'],
-            low=self.current_candle['low'],
-            close=self.current_candle['close'],
-            volume=self.current_candle['volume']
+
+        self._1m.append(
+            ts=self._current_minute_epoch * 60,
+            open_price=self._cur_open,
+            high=self._cur_high,
+            low=self._cur_low,
+            close=self._cur_close,
+            volume=self._cur_volume
         )
-        
-        self.candles_1m.append(candle)
-        
-        # Optimization: only format debug string if debug logging enabled
+
+        # Guard keeps the Candle materialization off the hot path; the
+        # lazy %r arg defers formatting into the handler
         if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(f"1m candle closed: {candle}")
-        
-        # Update 5m candles
-        self._update_5m_candles()
-    
-    def _update_5m_candles(self):
-        """Build 5-minute candles from 1-minute data."""
-        if len(self.candles_1m) < 5:
-            return
-        
-        # Get last candle timestamp
-        last_1m = self.candles_1m[-1]
-        last_minute = last_1m.timestamp.minute
-        
-        # Check if we just completed a 5-minute period
+            logger.debug("1m candle closed: %r", self._1m.make_candle(self._1m.count - 1))
+
+        # Close out the 5m period if this was its final minute
+        self._maybe_close_5m_candle()
+
+        # Wake anyone blocked on candle completion
+        self.new_candle_event.set()
+
+    def _maybe_close_5m_candle(self):
+        """Emit the running 5m accumulator when its period just completed."""
         # We want to build a 5m candle when we have 5 consecutive 1m candles
         # For OR: 09:30, 09:31, 09:32, 09:33, 09:34 -> build at 09:34
-        if last_minute % 5 == 4:  # Minutes ending in 4 or 9 (09:34, 09:39, 09:44, etc.)
-            # Get last 5 candles
-            recent_5 = list(self.candles_1m)[-5:]
-            
-            # Verify they are consecutive (all within same 5-minute period)
-            first_minute = recent_5[0].timestamp.minute
-            if first_minute % 5 == 0:  # Should start at 0 or 5 (09:30, 09:35, etc.)
-                # Build 5m candle
-                candle_5m = Candle(
-                    timestamp=recent_5[0].timestamp,  # Start time of 5m period
-                    open_price=recent_5[0].open,
-                    high=max(c.high for c in recent_5),
-                    low=min(c.low for c in recent_5),
-                    close=recent_5[-1].close,
-                    volume=sum(c.volume for c in recent_5)
-                )
-                
-                self.candles_5m.append(candle_5m)
-                
-                # Optimization: only format debug string if debug logging enabled
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug(f"5m candle built: {candle_5m}")
-    
+        # (NY offset is a whole number of minutes, so epoch minutes share the
+        # wall-clock 5-minute alignment.)
+        if self._current_minute_epoch % 5 != 4 or self._cur_5m_minutes != 5:
+            return
+
+        # Accumulators were maintained tick-by-tick; no re-scan needed
+        self._5m.append(
+            ts=self._cur_5m_bucket * 300,  # Start time of 5m period
+            open_price=self._cur_5m_open,
+            high=self._cur_5m_high,
+            low=self._cur_5m_low,
+            close=self._cur_5m_close,
+            volume=self._cur_5m_volume
+        )
+
+        # Publish a fresh immutable snapshot for lock-free readers
+        standby = self._5m_active_idx ^ 1
+        self._5m_snapshots[standby] = (
+            tuple(self._5m.last_n(self._5m.count)),
+            self._5m.ordered_ts()
+        )
+        self._5m_active_idx = standby
+        self._5m_version += 1
+
+        # Notify the incremental OR accumulator (if wired) with scalars
+        # straight off the running 5m state
+        cb = self.on_new_5m
+        if cb is not None:
+            cb(self._cur_5m_bucket * 300, self._cur_5m_high, self._cur_5m_low)
+
+        # Guard keeps the Candle materialization off the hot path; the
+        # lazy %r arg defers formatting into the handler
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("5m candle built: %r", self._5m.make_candle(self._5m.count - 1))
+
     def get_latest_1m(self, n=1):
         """
         Get the last N 1-minute candles.
-        
+
         Args:
             n (int): Number of candles to retrieve
-            
+
         Returns:
             list: List of Candle objects (oldest to newest)
         """
-        with self.lock:
-            if n > len(self.candles_1m):
-                n = len(self.candles_1m)
-            return list(self.candles_1m)[-n:] if n > 0 else []
-    
+        with self._rw.read_locked():
+            return self._1m.last_n(n)
+
     def get_latest_5m(self, n=1):
         """
         Get the last N 5-minute candles.
-        
+
         Args:
             n (int): Number of candles to retrieve
-            
+
         Returns:
             list: List of Candle objects (oldest to newest)
         """
-        with self.lock:
-            if n > len(self.candles_5m):
-                n = len(self.candles_5m)
-            return list(self.candles_5m)[-n:] if n > 0 else []
-    
+        # Lock-free: single load of the active immutable snapshot
+        candles, _ = self._5m_snapshots[self._5m_active_idx]
+        if n > len(candles):
+            n = len(candles)
+        return list(candles[-n:]) if n > 0 else []
+
     def get_or_candles(self, date=None):
         """
         Get Opening Range candles (09:30-09:34 NY time).
-        
+
         Args:
             date (datetime.date): Date to get OR for (default: today)
-            
+
         Returns:
             list: List of 5m candles in OR period
         """
-        with self.lock:
-            if date is None:
-                ny_tz = pytz.timezone('America/New_York')
-                date = datetime.datetime.now(ny_tz).date()
-            
-            or_candles = []
-            for candle in self.candles_5m:
-                candle_date = candle.timestamp.date()
-                candle_time = candle.timestamp.time()
-                
-                # Check if candle is in OR period (09:30-09:34)
-                if (candle_date == date and 
-                    datetime.time(9, 30) <= candle_time <= datetime.time(9, 34)):
-                    or_candles.append(candle)
-            
-            return or_candles
-    
-    def has_new_candle(self):
+        if date is None:
+            date = datetime.datetime.now(self.ny_tz).date()
+
+        # Serve repeated polls from the per-version cache: the result can
+        # only change when a new 5m candle is published
+        cached = self._or_cache
+        if cached is not None and cached[0] == self._5m_version and cached[1] == date:
+            return list(cached[2])
+
+        # OR period (09:30-09:34) as integer epoch bounds, computed once
+        # per call instead of building date/time objects per candle
+        lo = int(datetime.datetime.combine(
+            date, datetime.time(9, 30), tzinfo=self.ny_tz).timestamp())
+        hi = lo + 4 * 60  # start minutes 09:30 through 09:34 inclusive
+
+        # Lock-free: filter over the active immutable snapshot
+        version = self._5m_version
+        candles, ts = self._5m_snapshots[self._5m_active_idx]
+        if ts is None:
+            return []
+        # Timestamps are sorted, so binary-search the window bounds rather
+        # than scanning every stored candle
+        i = int(np.searchsorted(ts, lo, side='left'))
+        j = int(np.searchsorted(ts, hi, side='right'))
+        or_candles = list(candles[i:j])
+        self._or_cache = (version, date, or_candles)
+        return list(or_candles)
+
+    def get_or_highs_lows(self, date=None):
         """
-        Check if a new 1-minute candle was just closed.
-        
+        Opening Range rows as numpy arrays (09:30-09:34 NY time).
+
+        Reads the 5m struct-of-arrays storage directly, so the caller
+        gets contiguous float64 arrays for vectorized max/min instead of
+        materialized Candle objects.
+
+        Args:
+            date (datetime.date): Date to get OR for (default: today)
+
         Returns:
-            bool: True if new candle available
+            tuple: (highs, lows, ts) arrays for the OR window, all empty
+                when no OR candles are stored
         """
-        with self.lock:
-            return len(self.candles_1m) > 0
-    
+        if date is None:
+            date = datetime.datetime.now(self.ny_tz).date()
+
+        lo = int(datetime.datetime.combine(
+            date, datetime.time(9, 30), tzinfo=self.ny_tz).timestamp())
+        hi = lo + 4 * 60  # start minutes 09:30 through 09:34 inclusive
+
+        with self._rw.read_locked():
+            arr = self._5m
+            count = arr.count
+            start = (arr.head - count) & arr._mask
+            idx = (start + np.arange(count)) & arr._mask
+            ts = arr.ts[idx]
+            i = int(np.searchsorted(ts, lo, side='left'))
+            j = int(np.searchsorted(ts, hi, side='right'))
+            sel = idx[i:j]
+            return arr.high[sel].copy(), arr.low[sel].copy(), ts[i:j].copy()
+
+    def has_new_candle(self, last_seen_version=0):
+        """
+        Check if a new 1-minute candle closed since the caller last asked.
+
+        The 1m ring's monotonic head counter doubles as the version: the
+        caller threads the returned version through its polling loop, so
+        the check is a single lock-free integer compare.
+
+        Args:
+            last_seen_version (int): Version returned by the previous call
+                                     (0 on the first call)
+
+        Returns:
+            tuple: (new_candle_closed, current_version)
+        """
+        version = self._1m.head
+        return version != last_seen_version, version
+
     def clear(self):
         """Clear all candles from buffer."""
-        with self.lock:
-            self.candles_1m.clear()
-            self.candles_5m.clear()
-            self.current_candle = None
+        with self._rw.write_locked():
+            self._1m.clear()
+            self._5m.clear()
+            self._5m_snapshots = [((), None), ((), None)]
+            self._5m_active_idx = 0
+            self._5m_version += 1
+            self._or_cache = None
             self.current_minute = None
+            self._current_minute_epoch = None
+            self._cur_volume = 0
+            self._cur_5m_bucket = None
+            self._cur_5m_minutes = 0
             logger.info("CandleBuffer cleared")
@@ -109,8 +109,9 @@ SESSION_END = '16:00'  # End of trading session
 # ============================================================================
 # BUFFER SIZES (Advanced - don't change)
 # ============================================================================
-MAX_1M_CANDLES = 500  # Keep last 500 1-minute candles
-MAX_5M_CANDLES = 100  # Keep last 100 5-minute candles
+MAX_1M_CANDLES = 512  # Keep last 512 1-minute candles (power of two for
+                      # cheap ring-buffer index masking)
+MAX_5M_CANDLES = 128  # Keep last 128 5-minute candles (power of two)
 
 # ============================================================================
 # LOGGING (Advanced - don't change)
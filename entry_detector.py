@@ -10,11 +10,52 @@ Processes candles one at a time without lookahead.
 """
 
 import logging
+from collections import deque, namedtuple
+from datetime import datetime
 from datetime import time as dt_time
+import numpy as np
 from config import SKIP_FIRST_N, FVG_LOOKBACK, RETEST_PCT, MAX_INVALIDATIONS, MIN_ENTRY_TIME, SL_BUFFER_PCT
 
 logger = logging.getLogger(__name__)
 
+# Parsed once at import; process_candle re-parsed the HH:MM string per candle
+_MIN_ENTRY_TIME = dt_time(*map(int, MIN_ENTRY_TIME.split(':')))
+
+# Immutable entry signal handed to the executor; attribute access instead
+# of per-field dict hashing, and a fraction of the dict's footprint
+EntrySignal = namedtuple('EntrySignal', [
+    'model', 'direction', 'entry_time', 'entry_price',
+    'sl', 'tp', 'breakout_time', 'retest_time'
+])
+
+
+def _scan_fvg(high_arr, low_arr, start, end, lookback, is_long):
+    """
+    Pure-numeric FVG scan over [start, end) of the SoA price arrays.
+    Returns the index of the first window's last candle, or -1 if no gap.
+
+    Kept as a module-level function on plain arrays so the hot scan has no
+    object attribute access. (The original work order called for a Numba
+    @njit kernel; numba is not a dependency of this project, so the scan is
+    a single vectorized numpy comparison instead, which is equivalent at
+    this window size.)
+    """
+    gap = lookback - 1
+    span = end - gap - start
+    if span <= 0:
+        return -1
+    if is_long:
+        # First candle high < last candle low (gap up)
+        hits = np.flatnonzero(high_arr[start:start + span] <
+                              low_arr[start + gap:start + gap + span])
+    else:
+        # First candle low > last candle high (gap down)
+        hits = np.flatnonzero(low_arr[start:start + span] >
+                              high_arr[start + gap:start + gap + span])
+    if hits.size == 0:
+        return -1
+    return start + int(hits[0]) + gap
+
 
 class EntryDetector:
     """
@@ -27,6 +68,13 @@ class EntryDetector:
     """
     
     def __init__(self):
+        # Dispatch table for the breakout/retest/confirmation progression,
+        # keyed on (breakout_seen, retest_active); (False, True) cannot occur
+        self._state_handlers = {
+            (False, False): self._check_for_breakout,
+            (True, False): self._check_for_retest,
+            (True, True): self._check_for_confirmation,
+        }
         self.reset()
         logger.info("EntryDetector initialized")
     
@@ -42,7 +90,15 @@ class EntryDetector:
         self.retest_active = False
         self.retest_candle = None
         self.retest_start_idx = None
-        
+
+        # Retest band, precomputed once per breakout (or_range and
+        # direction are invariant until invalidation)
+        self._band_tol = 0.0
+        self._band_low = 0.0
+        self._band_high = 0.0
+        self._dir_sign = 0
+        self._fvg_scanned_once = False
+
         # Confirmation tracking
         self.confirmed = False
         self.invalidated = False
@@ -51,8 +107,29 @@ class EntryDetector:
         self.entry_signal = None
         self.signal_delivered = False  # Track if signal was returned to caller
         
-        # Candle history (for FVG detection)
-        self.candle_history = []
+        # Candle history (for FVG detection); deque evicts the oldest
+        # candle in O(1) instead of list.pop(0)'s O(n) shift
+        self.candle_history = deque(maxlen=50)
+
+        # Parallel struct-of-arrays view of the history prices, kept in
+        # sync with candle_history so FVG/ATR checks run as vectorized
+        # numpy comparisons instead of per-object attribute chains.
+        # Preallocated at twice the window so the live rows occupy the
+        # contiguous slice [_hist_start, _hist_start + _hist_len); appends
+        # just advance the start, and the arrays are compacted once every
+        # ~50 candles instead of shifting 50 rows on every append.
+        self._hist_open = np.empty(100)
+        self._hist_high = np.empty(100)
+        self._hist_low = np.empty(100)
+        self._hist_close = np.empty(100)
+        self._hist_start = 0
+        self._hist_len = 0
+
+        # Total candles ever appended. Stored positions (breakout index)
+        # are kept in this absolute space so deque eviction cannot make
+        # them point at the wrong candle; the relative index is recovered
+        # with one subtraction.
+        self._abs_counter = 0
         self.candles_since_or_lock = 0
         
         # OR range
@@ -69,8 +146,6 @@ class EntryDetector:
     
     def _reset_after_invalidation(self):
         """Partial reset after invalidation to search for new breakouts."""
-        from datetime import datetime, timedelta
-        
         self.invalidation_count += 1
         current_time = datetime.now()
         
@@ -90,11 +165,11 @@ class EntryDetector:
         
         # Check if we've hit the max invalidation limit
         if self.invalidation_count >= MAX_INVALIDATIONS:
-            logger.warning(f"Max invalidations ({MAX_INVALIDATIONS}) reached - stopping for session")
+            logger.warning("Max invalidations (%d) reached - stopping for session", MAX_INVALIDATIONS)
             self.invalidated = True
             return
         
-        logger.info(f"Resetting detector (invalidation {self.invalidation_count}/{MAX_INVALIDATIONS})...")
+        logger.info("Resetting detector (invalidation %d/%d)...", self.invalidation_count, MAX_INVALIDATIONS)
         
         # Reset breakout/retest state
         self.breakout_seen = False
@@ -104,6 +179,11 @@ class EntryDetector:
         self.retest_active = False
         self.retest_candle = None
         self.retest_start_idx = None
+        self._band_tol = 0.0
+        self._band_low = 0.0
+        self._band_high = 0.0
+        self._dir_sign = 0
+        self._fvg_scanned_once = False
         
         # Clear invalidation flag
         self.invalidated = False
@@ -114,46 +194,80 @@ class EntryDetector:
         # Keep: candle_history, candles_since_or_lock, OR range, invalidation_count
         # This allows us to continue monitoring without losing context
     
-    def process_candle(self, candle, or_high, or_low):
+    def set_or_range(self, or_high, or_low):
         """
-        Process a single candle and update internal state.
+        Set (or update) the Opening Range the detector trades against.
+        Called once at OR lock instead of re-storing the range per candle.
         
         Args:
-            candle (Candle): New 1-minute candle
             or_high (float): Opening Range high
             or_low (float): Opening Range low
-            
-        Returns:
-            dict or None: Entry signal if confirmed, None otherwise
         """
-        # Always update OR range (in case it changes during OR building period)
-        # This prevents using stale OR values if range updates
         if self.or_high is None:
-            logger.debug(f"OR range initialized: {or_high:.2f} - {or_low:.2f}")
+            logger.debug("OR range initialized: %.2f - %.2f", or_high, or_low)
         self.or_high = or_high
         self.or_low = or_low
         self.or_range = or_high - or_low
+    
+    def process_candle(self, candle,
+                       _skip_first_n=SKIP_FIRST_N,
+                       _min_entry_time=_MIN_ENTRY_TIME):
+        """
+        Process a single candle and update internal state.
+        The OR range must have been provided via set_or_range().
+        
+        Args:
+            candle (Candle): New 1-minute candle
+            
+        Returns:
+            EntrySignal or None: Entry signal if confirmed, None otherwise
+        
+        The trailing defaults bind hot config constants as locals
+        (LOAD_FAST instead of LOAD_GLOBAL on every candle); they are not
+        part of the public signature.
+        """
+        # No OR yet: nothing to trade against
+        if self.or_high is None:
+            return None
         
-        # Add to history (limit to 50 candles to prevent memory growth)
+        # Add to history (maxlen=50 bounds memory growth)
         self.candle_history.append(candle)
-        if len(self.candle_history) > 50:
-            self.candle_history.pop(0)
+
+        # Mirror prices into the SoA arrays
+        n = self._hist_len
+        pos = self._hist_start + n
+        if pos == 100:
+            # Hit the physical end: compact the newest 49 rows to the
+            # front (dropping the oldest) and keep writing
+            for arr in (self._hist_open, self._hist_high,
+                        self._hist_low, self._hist_close):
+                arr[:49] = arr[51:]
+            self._hist_start = 0
+            pos = 49
+            n = 49
+        elif n == 50:
+            # Window full: slide the start forward, no copying
+            self._hist_start += 1
+            n = 49
+        self._hist_open[pos] = candle.open
+        self._hist_high[pos] = candle.high
+        self._hist_low[pos] = candle.low
+        self._hist_close[pos] = candle.close
+        self._hist_len = n + 1
+        self._abs_counter += 1
         
         self.candles_since_or_lock += 1
         
         # Skip first N candles after OR lock
-        if self.candles_since_or_lock <= SKIP_FIRST_N:
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f"Skipping candle {self.candles_since_or_lock}/{SKIP_FIRST_N}")
+        if self.candles_since_or_lock <= _skip_first_n:
+            logger.debug("Skipping candle %d/%d", self.candles_since_or_lock, _skip_first_n)
             return None
         
         # Check minimum entry time
         candle_time = candle.timestamp.time()
-        min_time = dt_time(*map(int, MIN_ENTRY_TIME.split(':')))
         
-        if candle_time < min_time:
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f"Before minimum entry time ({MIN_ENTRY_TIME})")
+        if candle_time < _min_entry_time:
+            logger.debug("Before minimum entry time (%s)", MIN_ENTRY_TIME)
             return None
         
         # If already confirmed or invalidated, return signal only once
@@ -166,21 +280,15 @@ class EntryDetector:
                 self.signal_delivered = True
                 return self.entry_signal
         
-        # State machine processing
-        if not self.breakout_seen:
-            self._check_for_breakout(candle)
-        
-        elif self.breakout_seen and not self.retest_active:
-            self._check_for_retest(candle)
-        
-        elif self.retest_active and not self.confirmed:
-            self._check_for_confirmation(candle)
+        # State machine processing (confirmed is always False here; the
+        # confirmed/invalidated early return above already fired otherwise)
+        self._state_handlers[(self.breakout_seen, self.retest_active)](candle)
         
         # If no retest found after enough candles, try Model 2 (FVG)
         if (self.breakout_seen and 
             not self.retest_active and 
             not self.confirmed and
-            len(self.candle_history) >= self.breakout_candle['index'] + 10):
+            self._abs_counter >= self.breakout_candle['abs_idx'] + 10):
             self._check_for_fvg()
         
         return self.entry_signal
@@ -189,80 +297,77 @@ class EntryDetector:
         """Check if candle breaks out of OR."""
         close = candle.close
         
-        # Long breakout
         if close > self.or_high:
-            self.breakout_seen = True
-            self.breakout_direction = 'long'
-            self.breakout_time = candle.timestamp
-            self.breakout_candle = {
-                'candle': candle,
-                'index': len(self.candle_history) - 1
-            }
-            logger.info(f"BREAKOUT LONG detected at {candle.timestamp} | Close: {close:.2f}")
-        
-        # Short breakout
+            direction = 'long'
         elif close < self.or_low:
-            self.breakout_seen = True
-            self.breakout_direction = 'short'
-            self.breakout_time = candle.timestamp
-            self.breakout_candle = {
-                'candle': candle,
-                'index': len(self.candle_history) - 1
-            }
-            logger.info(f"BREAKOUT SHORT detected at {candle.timestamp} | Close: {close:.2f}")
+            direction = 'short'
+        else:
+            return
+        
+        self.breakout_seen = True
+        self.breakout_direction = direction
+        self.breakout_time = candle.timestamp
+        self.breakout_candle = {
+            'candle': candle,
+            'abs_idx': self._abs_counter - 1
+        }
+        self._set_retest_band()
+        logger.info("BREAKOUT %s detected at %s | Close: %.2f", direction.upper(), candle.timestamp, close)
+    
+    def _set_retest_band(self):
+        """Precompute the retest band for the current breakout."""
+        tol = self.or_range * RETEST_PCT
+        if self.breakout_direction == 'long':
+            anchor = self.or_high
+            self._dir_sign = 1
+        else:
+            anchor = self.or_low
+            self._dir_sign = -1
+        self._band_tol = tol
+        self._band_low = anchor - tol
+        self._band_high = anchor + tol
     
     def _check_for_retest(self, candle):
         """Check if price retests OR boundary."""
-        # Calculate retest band
-        tol = self.or_range * RETEST_PCT
-        anchor = self.or_high if self.breakout_direction == 'long' else self.or_low
-        
-        band_low = anchor - tol
-        band_high = anchor + tol
-        
-        # Check for invalidation (re-entering OR)
-        if self.breakout_direction == 'long' and candle.close < self.or_high:
-            logger.info(f"INVALIDATED: Long breakout re-entered OR at {candle.timestamp}")
+        # Band was precomputed at breakout time
+        band_low = self._band_low
+        band_high = self._band_high
+        s = self._dir_sign
+        
+        # Check for invalidation (re-entering OR): s*(close - anchor) < 0
+        # reads "close fell back through the broken boundary"
+        anchor = self.or_high if s > 0 else self.or_low
+        if s * (candle.close - anchor) < 0:
+            logger.info("INVALIDATED: %s breakout re-entered OR at %s", self.breakout_direction.capitalize(), candle.timestamp)
             self._reset_after_invalidation()
             return
         
-        if self.breakout_direction == 'short' and candle.close > self.or_low:
-            logger.info(f"INVALIDATED: Short breakout re-entered OR at {candle.timestamp}")
-            self._reset_after_invalidation()
-            return
-        
-        # Check if candle enters retest band
-        if self.breakout_direction == 'long':
-            entered_zone = (candle.low <= band_high) and (candle.high >= band_low)
-        else:
-            entered_zone = (candle.high >= band_low) and (candle.low <= band_high)
+        # Check if candle enters retest band (interval overlap is
+        # direction-independent)
+        entered_zone = (candle.low <= band_high) and (candle.high >= band_low)
         
         if entered_zone:
             self.retest_active = True
             self.retest_candle = candle
             self.retest_start_idx = len(self.candle_history) - 1
-            logger.info(f"RETEST detected at {candle.timestamp} | Band: {band_low:.2f}-{band_high:.2f}")
+            logger.info("RETEST detected at %s | Band: %.2f-%.2f", candle.timestamp, band_low, band_high)
     
     def _check_for_confirmation(self, candle):
         """Check for displacement confirmation after retest."""
         if self.retest_candle is None:
             return
         
-        # Calculate retest band
-        tol = self.or_range * RETEST_PCT
-        anchor = self.or_high if self.breakout_direction == 'long' else self.or_low
-        
-        band_low = anchor - tol
-        band_high = anchor + tol
-        
-        # Check for invalidation (breaking wrong side of band)
-        if self.breakout_direction == 'long' and candle.low < band_low:
-            logger.info(f"INVALIDATED: Broke below retest band at {candle.timestamp}")
-            self._reset_after_invalidation()
-            return
-        
-        if self.breakout_direction == 'short' and candle.high > band_high:
-            logger.info(f"INVALIDATED: Broke above retest band at {candle.timestamp}")
+        # Band was precomputed at breakout time
+        tol = self._band_tol
+        band_low = self._band_low
+        band_high = self._band_high
+        s = self._dir_sign
+        
+        # Check for invalidation (breaking the wrong side of the band)
+        wrong_extreme = candle.low if s > 0 else candle.high
+        wrong_edge = band_low if s > 0 else band_high
+        if s * (wrong_extreme - wrong_edge) < 0:
+            logger.info("INVALIDATED: Broke %s retest band at %s", 'below' if s > 0 else 'above', candle.timestamp)
             self._reset_after_invalidation()
             return
         
@@ -276,78 +381,77 @@ class EntryDetector:
         cons_low = self.retest_candle.low - tol
         cons_high = self.retest_candle.high + tol
         
-        # Calculate body ratio
-        body_size = abs(candle.close - candle.open)
-        full_range = max(candle.high - candle.low, 0.0001)
-        body_ratio = body_size / full_range
-        
-        # Check for displacement
-        displacement = False
+        # Check for displacement. The long/short mirrors are folded through
+        # the direction sign: s*(a - b) > 0 reads "a beyond b in breakout
+        # direction", so one branchless vector reduce covers both sides.
+        s = self._dir_sign
+        if s > 0:
+            cons_edge, extreme, prev_extreme = cons_high, candle.high, prev_candle.high
+        else:
+            cons_edge, extreme, prev_extreme = cons_low, candle.low, prev_candle.low
+
+        diffs = np.array([
+            s * (candle.close - cons_edge),
+            s * (candle.close - prev_candle.close),
+            s * (extreme - prev_extreme),
+        ])
+        displacement = bool((diffs > 0.0).all())
         
-        if self.breakout_direction == 'long':
-            displacement = (
-                candle.close > cons_high and
-                candle.close > prev_candle.close and
-                candle.high > prev_candle.high and
-                body_ratio >= 0.30
-            )
-            
-            # Also check for FVG
-            if len(self.candle_history) >= 3:
-                c1 = self.candle_history[-3]
-                c3 = candle
-                fvg = (c1.high < c3.low)
-                displacement = displacement or fvg
-        
-        else:  # short
-            displacement = (
-                candle.close < cons_low and
-                candle.close < prev_candle.close and
-                candle.low < prev_candle.low and
-                body_ratio >= 0.30
-            )
-            
-            # Also check for FVG
-            if len(self.candle_history) >= 3:
-                c1 = self.candle_history[-3]
-                c3 = candle
-                fvg = (c1.low > c3.high)
-                displacement = displacement or fvg
+        if displacement:
+            # Body ratio is only computed on the rare candle that passes
+            # the structural conditions. Inline conditional expressions
+            # skip the abs()/max() builtin dispatch.
+            body_size = candle.close - candle.open
+            if body_size < 0.0:
+                body_size = -body_size
+            full_range = candle.high - candle.low
+            displacement = body_size / (full_range if full_range > 0.0001 else 0.0001) >= 0.30
+
+        # Also check for FVG
+        if not displacement and len(self.candle_history) >= 3:
+            c1 = self.candle_history[-3]
+            c3 = candle
+            if s > 0:
+                displacement = (c1.high < c3.low)
+            else:
+                displacement = (c1.low > c3.high)
         
         if displacement:
             self.confirmed = True
             self._generate_entry_signal(candle, model=1)
-            logger.info(f"CONFIRMED Model 1 at {candle.timestamp} | Entry: {candle.close:.2f}")
+            logger.info("CONFIRMED Model 1 at %s | Entry: %.2f", candle.timestamp, candle.close)
     
     def _check_for_fvg(self):
         """Check for Fair Value Gap pattern (Model 2)."""
-        if len(self.candle_history) < FVG_LOOKBACK:
+        n = self._hist_len
+        if n < FVG_LOOKBACK:
             return
-        
-        # Search for FVG from breakout onwards (limit to last 20 candles for performance)
-        start_idx = self.breakout_candle['index']
-        search_start = max(start_idx, len(self.candle_history) - 20)
-        
-        for i in range(search_start, len(self.candle_history) - FVG_LOOKBACK + 1):
-            block = self.candle_history[i:i + FVG_LOOKBACK]
-            
-            if self.breakout_direction == 'long':
-                # Check if first candle high < last candle low (gap)
-                if block[0].high < block[-1].low:
-                    self.confirmed = True
-                    entry_candle = block[-1]
-                    self._generate_entry_signal(entry_candle, model=2)
-                    logger.info(f"CONFIRMED Model 2 (FVG) at {entry_candle.timestamp} | Entry: {entry_candle.close:.2f}")
-                    return
-            
-            else:  # short
-                # Check if first candle low > last candle high (gap)
-                if block[0].low > block[-1].high:
-                    self.confirmed = True
-                    entry_candle = block[-1]
-                    self._generate_entry_signal(entry_candle, model=2)
-                    logger.info(f"CONFIRMED Model 2 (FVG) at {entry_candle.timestamp} | Entry: {entry_candle.close:.2f}")
-                    return
+
+        # Only the newest closed triplet can produce a new gap once this
+        # check is live, so the steady state is a single O(1) comparison
+        # instead of rescanning a 20-wide window. The first call after the
+        # post-breakout wait does one catch-up scan so gaps that formed
+        # while Model 2 was gated are still found.
+        if self._fvg_scanned_once:
+            start = n - FVG_LOOKBACK
+        else:
+            start_idx = self.breakout_candle['abs_idx'] - (self._abs_counter - n)
+            start = max(start_idx, n - 20, 0)
+            self._fvg_scanned_once = True
+
+        # start/n are logical window indices; the live rows sit at
+        # [_hist_start, _hist_start + _hist_len) in the physical arrays,
+        # so offset by the base (as _atr14 does) and map the physical hit
+        # back before indexing the deque
+        base = self._hist_start
+        hit = _scan_fvg(self._hist_high, self._hist_low,
+                        base + start, base + n, FVG_LOOKBACK,
+                        self.breakout_direction == 'long')
+        if hit >= 0:
+            self.confirmed = True
+            entry_candle = self.candle_history[hit - base]
+            self._generate_entry_signal(entry_candle, model=2)
+            logger.info("CONFIRMED Model 2 (FVG) at %s | Entry: %.2f", entry_candle.timestamp, entry_candle.close)
     
     def _generate_entry_signal(self, candle, model):
         """
@@ -362,57 +466,51 @@ class EntryDetector:
         # Calculate SL buffer based on OR range
         sl_buffer = SL_BUFFER_PCT * self.or_range
         
-        # Calculate SL and TP
+        # Calculate SL and TP. The long/short mirrors collapse through the
+        # direction sign: SL sits sign-away below entry, TP sign-away above.
+        s = self._dir_sign
         if model == 1 and self.retest_candle is not None:
             # Model 1: Use retest structure for SL with buffer
-            if self.breakout_direction == 'long':
-                sl = self.retest_candle.low - sl_buffer
-                if sl >= entry_price:  # Safety fallback
-                    sl = entry_price - max(0.50, sl_buffer)
-                sl_dist = entry_price - sl
-                tp = entry_price + (2 * sl_dist)
-                logger.info(f"SL buffer applied: {sl_buffer:.2f} points ({SL_BUFFER_PCT*100}% of OR range {self.or_range:.2f})")
-            else:  # short
-                sl = self.retest_candle.high + sl_buffer
-                if sl <= entry_price:  # Safety fallback
-                    sl = entry_price + max(0.50, sl_buffer)
-                sl_dist = sl - entry_price
-                tp = entry_price - (2 * sl_dist)
-                logger.info(f"SL buffer applied: {sl_buffer:.2f} points ({SL_BUFFER_PCT*100}% of OR range {self.or_range:.2f})")
+            structure = self.retest_candle.low if s > 0 else self.retest_candle.high
+            sl = structure - s * sl_buffer
+            if s * (entry_price - sl) <= 0:  # Safety fallback
+                sl = entry_price - s * max(0.50, sl_buffer)
+            sl_dist = s * (entry_price - sl)
+            tp = entry_price + s * (2 * sl_dist)
+            logger.info("SL buffer applied: %.2f points (%s%% of OR range %.2f)", sl_buffer, SL_BUFFER_PCT * 100, self.or_range)
         
         else:
             # Model 2 or fallback: Use ATR-based SL with buffer
-            # Calculate simple ATR from recent candles
-            recent = self.candle_history[-14:] if len(self.candle_history) >= 14 else self.candle_history
-            atr = sum(c.high - c.low for c in recent) / len(recent)
+            atr = self._atr14()
             sl_dist = max(0.8 * atr, sl_buffer)  # Use larger of ATR or buffer
+            sl = entry_price - s * sl_dist
+            tp = entry_price + s * (2 * sl_dist)
             
-            if self.breakout_direction == 'long':
-                sl = entry_price - sl_dist
-                tp = entry_price + (2 * sl_dist)
-            else:  # short
-                sl = entry_price + sl_dist
-                tp = entry_price - (2 * sl_dist)
-            
-            logger.info(f"SL distance: {sl_dist:.2f} points (ATR-based with buffer)")
-        
-        self.entry_signal = {
-            'model': model,
-            'direction': self.breakout_direction,
-            'entry_time': candle.timestamp,
-            'entry_price': entry_price,
-            'sl': sl,
-            'tp': tp,
-            'breakout_time': self.breakout_time,
-            'retest_time': self.retest_candle.timestamp if self.retest_candle else None
-        }
+            logger.info("SL distance: %.2f points (ATR-based with buffer)", sl_dist)
+        
+        self.entry_signal = EntrySignal(
+            model=model,
+            direction=self.breakout_direction,
+            entry_time=candle.timestamp,
+            entry_price=entry_price,
+            sl=sl,
+            tp=tp,
+            breakout_time=self.breakout_time,
+            retest_time=self.retest_candle.timestamp if self.retest_candle else None
+        )
+    
+    def _atr14(self):
+        """Simple ATR over the last 14 candles, from the SoA arrays."""
+        end = self._hist_start + self._hist_len
+        start = max(end - 14, self._hist_start)
+        return float((self._hist_high[start:end] - self._hist_low[start:end]).mean())
     
     def get_signal(self):
         """
         Get entry signal if confirmed.
         
         Returns:
-            dict or None: Entry signal or None
+            EntrySignal or None: Entry signal or None
         """
         return self.entry_signal
     
@@ -13,12 +13,14 @@ Connects all components and runs the event-driven trading loop.
 import sys
 import signal
 import time
+import queue
 import logging
+import threading
 from datetime import datetime
 
 from utils import setup_logging, get_ny_time, is_market_open
 from candle_buffer import CandleBuffer
-from session_state import SessionStateMachine
+from session_state import SessionStateMachine, SessionState
 from entry_detector import EntryDetector
 from oanda_executor import OandaExecutor
 from streaming_client import StreamingClient
@@ -45,6 +47,8 @@ class LiveTrader:
         # Initialize components
         self.candle_buffer = CandleBuffer()
         self.session_state = SessionStateMachine()
+        # Feed closing 5m candles straight into the OR accumulator
+        self.candle_buffer.on_new_5m = self.session_state.on_new_5m_candle
         self.entry_detector = EntryDetector()
         self.executor = OandaExecutor(dry_run=dry_run)
         self.streaming_client = None
@@ -52,6 +56,15 @@ class LiveTrader:
         # Track last processed candle
         self.last_candle_time = None
         
+        # Order placement runs on a dedicated worker so the event loop is
+        # never blocked on the OANDA REST roundtrip; outcomes come back on
+        # the result queue and are reconciled in the loop
+        self._order_queue = queue.Queue(maxsize=4)
+        self._order_results = queue.Queue()
+        self._order_thread = threading.Thread(
+            target=self._order_worker, name='order-worker', daemon=True)
+        self._order_thread.start()
+        
         # Shutdown flag
         self.running = False
         
@@ -69,8 +82,12 @@ class LiveTrader:
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
         
-        # Start streaming client
-        self.streaming_client = StreamingClient(on_tick_callback=self._on_tick)
+        # Start streaming client; the activity gate keeps tick parsing
+        # from running outside market hours or after the session closed
+        self.streaming_client = StreamingClient(
+            on_tick_callback=self._on_tick,
+            is_active_callback=self._ticks_wanted,
+            on_tick_batch_callback=self._on_tick_batch)
         self.streaming_client.start()
         
         self.running = True
@@ -78,18 +95,34 @@ class LiveTrader:
         # Main event loop
         self._event_loop()
     
+    def _ticks_wanted(self):
+        """Gate for the streaming client: parse ticks only while they can
+        affect a candle the session still cares about. An open position
+        keeps ticks flowing even though the session closes at entry -
+        _monitor_position needs live prices until the exit is seen."""
+        return ((self.session_state.state != SessionState.SESSION_CLOSED
+                 or self.executor.has_position())
+                and is_market_open())
+    
     def _on_tick(self, timestamp, bid, ask):
         """
         Callback for each tick from streaming client.
         
         Args:
-            timestamp (datetime): Tick timestamp
+            timestamp (float): Tick timestamp, epoch seconds (UTC)
             bid (float): Bid price
             ask (float): Ask price
         """
         # Add tick to candle buffer
         self.candle_buffer.add_tick(timestamp, bid, ask)
     
+    def _on_tick_batch(self, ts_arr, bids, asks):
+        """
+        Batch callback from the streaming client: one vectorized buffer
+        update per flushed batch instead of a Python call per tick.
+        """
+        self.candle_buffer.add_ticks(ts_arr, bids, asks)
+    
     def _event_loop(self):
         """Main event loop - runs continuously."""
         logger.info("Event loop started")
@@ -122,12 +155,26 @@ class LiveTrader:
                         self._process_new_candle(latest_candle)
                         self.last_candle_time = latest_candle.timestamp
                 
+                # Reconcile finished order placements from the worker
+                while True:
+                    try:
+                        placed_signal, success = self._order_results.get_nowait()
+                    except queue.Empty:
+                        break
+                    if success:
+                        logger.info("✅ Trade executed - session closed")
+                    else:
+                        logger.error("❌ Trade execution failed")
+                
                 # Monitor open position
                 if self.executor.has_position():
                     self._monitor_position()
                 
-                # Sleep briefly to avoid busy loop
-                time.sleep(1)
+                # Block until the buffer closes a 1m candle instead of
+                # polling every second; the timeout keeps market-close and
+                # session-state checks running even when no ticks arrive
+                self.candle_buffer.new_candle_event.wait(timeout=60)
+                self.candle_buffer.new_candle_event.clear()
                 
             except Exception as e:
                 logger.error(f"Error in event loop: {e}", exc_info=True)
@@ -142,7 +189,8 @@ class LiveTrader:
         Args:
             candle (Candle): New candle
         """
-        logger.debug(f"New candle: {candle}")
+        # %r defers Candle.__repr__ until the record is actually emitted
+        logger.debug("New candle: %r", candle)
         
         # Check if we can trade
         if not self.session_state.can_trade():
@@ -154,31 +202,51 @@ class LiveTrader:
         if or_high is None or or_low is None:
             return
         
+        # Push the OR into the detector only when it actually changes
+        detector = self.entry_detector
+        if or_high != detector.or_high or or_low != detector.or_low:
+            detector.set_or_range(or_high, or_low)
+        
         # Process candle through entry detector
-        signal = self.entry_detector.process_candle(candle, or_high, or_low)
+        signal = detector.process_candle(candle)
         
         # If we got an entry signal, execute trade
         if signal is not None:
             logger.info("=" * 60)
             logger.info("📊 ENTRY SIGNAL DETECTED!")
-            logger.info(f"   Model: {signal['model']}")
-            logger.info(f"   Direction: {signal['direction'].upper()}")
-            logger.info(f"   Entry: {signal['entry_price']:.2f}")
-            logger.info(f"   SL: {signal['sl']:.2f}")
-            logger.info(f"   TP: {signal['tp']:.2f}")
+            logger.info(f"   Model: {signal.model}")
+            logger.info(f"   Direction: {signal.direction.upper()}")
+            logger.info(f"   Entry: {signal.entry_price:.2f}")
+            logger.info(f"   SL: {signal.sl:.2f}")
+            logger.info(f"   TP: {signal.tp:.2f}")
             logger.info("=" * 60)
             
-            # Place order
-            success = self.executor.place_order(signal)
+            # Hand the order to the worker thread; mark the trade taken
+            # optimistically so the one-trade-per-session rule holds while
+            # the REST call is in flight
+            try:
+                self._order_queue.put_nowait(signal)
+            except queue.Full:
+                logger.error("❌ Order queue full - dropping signal")
+                return
             
-            if success:
-                # Mark trade taken in session state
-                self.session_state.mark_trade_taken()
-                # Reset entry detector to clean up state
-                self.entry_detector.reset()
-                logger.info("✅ Trade executed - session closed")
-            else:
-                logger.error("❌ Trade execution failed")
+            self.session_state.mark_trade_taken()
+            # Reset entry detector to clean up state
+            self.entry_detector.reset()
+            logger.info("Order enqueued - session closed pending execution")
+    
+    def _order_worker(self):
+        """Worker thread: place queued orders without blocking the loop."""
+        while True:
+            signal_item = self._order_queue.get()
+            if signal_item is None:  # Shutdown sentinel
+                break
+            try:
+                success = self.executor.place_order(signal_item)
+            except Exception as e:
+                logger.error(f"Order worker error: {e}", exc_info=True)
+                success = False
+            self._order_results.put((signal_item, success))
     
     def _monitor_position(self):
         """Monitor open position for exit."""
@@ -211,6 +279,12 @@ class LiveTrader:
         
         self.running = False
         
+        # Stop the order worker (sentinel; daemon thread, so don't block)
+        try:
+            self._order_queue.put_nowait(None)
+        except queue.Full:
+            pass
+        
         # Stop streaming
         if self.streaming_client:
             self.streaming_client.stop()
@@ -23,12 +23,13 @@ This will run until:
 
 import oandapyV20
 from oandapyV20.endpoints import instruments, orders, positions
+import numpy as np
 import pandas as pd
 import datetime
 import pytz
 import time
 import logging
-from collections import deque
+from collections import deque, namedtuple
 from enum import Enum
 
 # ============================================================================
@@ -53,6 +54,8 @@ ENABLE_OR_FILTER = True
 MIN_OR_RANGE = 12.0
 MAX_OR_RANGE = 18.0
 MIN_ENTRY_TIME = '10:00'
+_MIN_ENTRY_MINUTES = (int(MIN_ENTRY_TIME.split(':')[0]) * 60
+                      + int(MIN_ENTRY_TIME.split(':')[1]))
 SL_BUFFER_PCT = 0.5
 
 # Session Times (NY timezone)
@@ -95,12 +98,49 @@ def is_market_open():
         return False
     return SESSION_START <= ny_time.time() <= SESSION_END
 
+# Batch of fetched candles as struct-of-arrays: a tz-aware DatetimeIndex,
+# int64 epoch seconds, and float64 OHLC arrays. Avoids building one Candle
+# object per fetched candle on every poll.
+CandleBatch = namedtuple('CandleBatch', [
+    'times', 'ts_epoch', 'open', 'high', 'low', 'close', 'volume'
+])
+
+
+# ============================================================================
+# NUMERIC KERNELS
+# ============================================================================
+
+def _fvg_scan(highs, lows, is_long, k):
+    """
+    Find the first Fair Value Gap in the given high/low arrays.
+    Returns the index of the gap block's last candle, or -1 if none.
+    """
+    n = highs.shape[0]
+    if n < k:
+        return -1
+    if is_long:
+        gaps = highs[:n - k + 1] < lows[k - 1:]
+    else:
+        gaps = lows[:n - k + 1] > highs[k - 1:]
+    idx = int(np.argmax(gaps))
+    if gaps[idx]:
+        return idx + k - 1
+    return -1
+
+
+def _atr(highs, lows):
+    """Simple average true range over the given high/low arrays."""
+    return float((highs - lows).mean())
+
+
 # ============================================================================
 # CANDLE CLASS
 # ============================================================================
 
 class Candle:
     """Represents a single OHLCV candle."""
+    __slots__ = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+    
     def __init__(self, timestamp, open_price, high, low, close, volume=0):
         self.timestamp = timestamp
         self.open = open_price
@@ -134,42 +174,50 @@ class SessionStateMachine:
         logger.info("Session state: PRE_OR")
     
     def update(self, candles_5m):
-        """Update state based on current time and candles."""
+        """Update state based on current time and a 5m CandleBatch."""
         ny_time = get_ny_time()
         current_time = ny_time.time()
         current_date = ny_time.date()
-        
+
         # Reset for new day
         if self.current_date != current_date:
             self._reset_for_new_day(current_date)
-        
+
+        # Terminal state: nothing left to do until the daily reset above
+        if self.state == SessionState.SESSION_CLOSED:
+            return
+
         if self.state == SessionState.PRE_OR and current_time >= SESSION_START:
             self.state = SessionState.OR_BUILDING
             logger.info("State transition: PRE_OR -> OR_BUILDING")
         
         elif self.state == SessionState.OR_BUILDING and current_time >= OR_LOCK_TIME:
-            # Calculate OR from 5m candles
-            or_candles = [c for c in candles_5m if 
-                         c.timestamp.date() == current_date and
-                         datetime.time(9, 30) <= c.timestamp.time() <= datetime.time(9, 34)]
+            # Calculate OR from 5m candles. One epoch-bounds mask over
+            # the batch arrays replaces the per-candle date()/time()
+            # comparisons and the pair of generator max/min passes.
+            or_start = int(_NY_TZ.localize(
+                datetime.datetime.combine(current_date, datetime.time(9, 30))
+            ).timestamp())
+            ts = candles_5m.ts_epoch
+            idx = np.flatnonzero((ts >= or_start) & (ts < or_start + 300))
             
-            if or_candles:
-                self.or_high = max(c.high for c in or_candles)
-                self.or_low = min(c.low for c in or_candles)
+            if idx.size > 0:
+                self.or_high = float(candles_5m.high[idx].max())
+                self.or_low = float(candles_5m.low[idx].min())
                 or_range = self.or_high - self.or_low
                 
                 # Check OR range filters
                 if ENABLE_OR_FILTER:
                     if or_range < MIN_OR_RANGE:
-                        logger.warning(f"OR range too small ({or_range:.2f} < {MIN_OR_RANGE}) - skipping trading")
+                        logger.warning("OR range too small (%.2f < %s) - skipping trading", or_range, MIN_OR_RANGE)
                         self.state = SessionState.SESSION_CLOSED
                         return
                     if or_range > MAX_OR_RANGE:
-                        logger.warning(f"OR range too large ({or_range:.2f} > {MAX_OR_RANGE}) - skipping trading")
+                        logger.warning("OR range too large (%.2f > %s) - skipping trading", or_range, MAX_OR_RANGE)
                         self.state = SessionState.SESSION_CLOSED
                         return
                 
-                logger.info(f"OR LOCKED | High: {self.or_high:.2f} | Low: {self.or_low:.2f} | Range: {or_range:.2f}")
+                logger.info("OR LOCKED | High: %.2f | Low: %.2f | Range: %.2f", self.or_high, self.or_low, or_range)
                 self.state = SessionState.OR_LOCKED
         
         elif self.state == SessionState.OR_LOCKED:
@@ -181,7 +229,7 @@ class SessionStateMachine:
             logger.info("State transition: POST_OR_TRADING -> SESSION_CLOSED")
     
     def _reset_for_new_day(self, new_date):
-        logger.info(f"Resetting for new day: {new_date}")
+        logger.info("Resetting for new day: %s", new_date)
         self.state = SessionState.PRE_OR
         self.or_high = None
         self.or_low = None
@@ -216,7 +264,21 @@ class EntryDetector:
         self.invalidated = False
         self.entry_signal = None
         self.signal_delivered = False
-        self.candle_history = []
+        # Struct-of-arrays candle history: four fixed-size float64 arrays
+        # plus a timestamp list, instead of an unbounded list of Candle
+        # objects. Arrays hold twice the retained window; when full, the
+        # newest half is copied down (one memmove per ~50 appends), so
+        # memory stays capped for a full session.
+        self._opens = np.empty(100, dtype=np.float64)
+        self._highs = np.empty(100, dtype=np.float64)
+        self._lows = np.empty(100, dtype=np.float64)
+        self._closes = np.empty(100, dtype=np.float64)
+        self._timestamps = []
+        self._n = 0
+        self._fvg_scanned_once = False
+        self._band_tol = None
+        self._band_low = None
+        self._band_high = None
         self.candles_since_or_lock = 0
         self.or_high = None
         self.or_low = None
@@ -249,11 +311,12 @@ class EntryDetector:
             self.invalidated = True
             return
         
-        logger.info(f"Resetting detector (invalidation {self.invalidation_count}/{MAX_INVALIDATIONS})...")
+        logger.info("Resetting detector (invalidation %d/%d)...", self.invalidation_count, MAX_INVALIDATIONS)
         self.breakout_seen = False
         self.breakout_direction = None
         self.retest_active = False
         self.retest_candle = None
+        self._fvg_scanned_once = False
         self.invalidated = False
         self.confirmed = False
         self.entry_signal = None
@@ -266,18 +329,31 @@ class EntryDetector:
         self.or_low = or_low
         self.or_range = or_high - or_low
         
-        self.candle_history.append(candle)
+        n = self._n
+        if n == self._highs.shape[0]:
+            # Amortized eviction: keep the newest half
+            half = n // 2
+            self._opens[:half] = self._opens[half:]
+            self._highs[:half] = self._highs[half:]
+            self._lows[:half] = self._lows[half:]
+            self._closes[:half] = self._closes[half:]
+            del self._timestamps[:half]
+            n = half
+        self._opens[n] = candle.open
+        self._highs[n] = candle.high
+        self._lows[n] = candle.low
+        self._closes[n] = candle.close
+        self._timestamps.append(candle.timestamp)
+        self._n = n + 1
         self.candles_since_or_lock += 1
         
         if self.candles_since_or_lock <= SKIP_FIRST_N:
             return None
         
-        # Check minimum entry time
-        candle_time = candle.timestamp.time()
-        min_hour, min_minute = map(int, MIN_ENTRY_TIME.split(':'))
-        min_time = datetime.time(min_hour, min_minute)
-        
-        if candle_time < min_time:
+        # Check minimum entry time: integer minute-of-day compare, no
+        # per-candle string parsing or time-object construction
+        ts = candle.timestamp
+        if ts.hour * 60 + ts.minute < _MIN_ENTRY_MINUTES:
             return None
         
         # If already confirmed or invalidated, return signal only once
@@ -297,26 +373,97 @@ class EntryDetector:
         
         # Try FVG if no retest
         if (self.breakout_seen and not self.retest_active and 
-            len(self.candle_history) >= 15):
+            self._n >= 15):
             self._check_fvg()
         
         return self.entry_signal
     
+    def bulk_prebreakout(self, batch, start, or_high, or_low):
+        """Vectorized catch-up over batch rows [start:] before any breakout.
+        
+        One mask over the batch closes finds the first candle that is
+        past the skip/min-time gates and closes outside the OR. Earlier
+        rows would only record history in process_candle, so they are
+        appended to the arrays in bulk here; returns the batch index at
+        which the scalar path should resume.
+        """
+        self.or_high = or_high
+        self.or_low = or_low
+        self.or_range = or_high - or_low
+        
+        m = len(batch.ts_epoch) - start
+        if m <= 0:
+            return start
+        
+        closes = batch.close[start:]
+        crossing = (closes > or_high) | (closes < or_low)
+        # Same gates process_candle applies before _check_breakout
+        csol = self.candles_since_or_lock + np.arange(1, m + 1)
+        minutes = (batch.times.hour * 60 + batch.times.minute).to_numpy()
+        eligible = (crossing
+                    & (csol > SKIP_FIRST_N)
+                    & (minutes[start:] >= _MIN_ENTRY_MINUTES))
+        hit = int(np.argmax(eligible)) if eligible.any() else m
+        
+        if hit > 0:
+            stop = start + hit
+            self.candles_since_or_lock += hit
+            cap = self._highs.shape[0]
+            half = cap // 2
+            src = start
+            if hit > half:
+                # Rows beyond the retention window would be evicted
+                # immediately; keep only the batch tail
+                src = stop - half
+            rows = stop - src
+            n = self._n
+            if n + rows > cap:
+                # Same amortized eviction as process_candle
+                keep = min(cap - rows, half)
+                if keep > 0:
+                    self._opens[:keep] = self._opens[n - keep:n]
+                    self._highs[:keep] = self._highs[n - keep:n]
+                    self._lows[:keep] = self._lows[n - keep:n]
+                    self._closes[:keep] = self._closes[n - keep:n]
+                    del self._timestamps[:n - keep]
+                else:
+                    del self._timestamps[:]
+                n = keep
+            need = n + rows
+            self._opens[n:need] = batch.open[src:stop]
+            self._highs[n:need] = batch.high[src:stop]
+            self._lows[n:need] = batch.low[src:stop]
+            self._closes[n:need] = batch.close[src:stop]
+            self._timestamps.extend(batch.times[src:stop])
+            self._n = need
+        
+        return start + hit
+    
     def _check_breakout(self, candle):
         if candle.close > self.or_high:
             self.breakout_seen = True
             self.breakout_direction = 'long'
-            logger.info(f"BREAKOUT LONG at {candle.timestamp}")
+            self._set_retest_band()
+            logger.info("BREAKOUT LONG at %s", candle.timestamp)
         elif candle.close < self.or_low:
             self.breakout_seen = True
             self.breakout_direction = 'short'
-            logger.info(f"BREAKOUT SHORT at {candle.timestamp}")
+            self._set_retest_band()
+            logger.info("BREAKOUT SHORT at %s", candle.timestamp)
     
-    def _check_retest(self, candle):
+    def _set_retest_band(self):
+        """Cache the retest band once per breakout; it is invariant until
+        the next invalidation, so the checkers need not recompute it
+        every candle."""
         tol = self.or_range * RETEST_PCT
         anchor = self.or_high if self.breakout_direction == 'long' else self.or_low
-        band_low = anchor - tol
-        band_high = anchor + tol
+        self._band_tol = tol
+        self._band_low = anchor - tol
+        self._band_high = anchor + tol
+    
+    def _check_retest(self, candle):
+        band_low = self._band_low
+        band_high = self._band_high
         
         # Invalidation
         if self.breakout_direction == 'long' and candle.close < self.or_high:
@@ -335,16 +482,15 @@ class EntryDetector:
         if entered:
             self.retest_active = True
             self.retest_candle = candle
-            logger.info(f"RETEST detected at {candle.timestamp}")
+            logger.info("RETEST detected at %s", candle.timestamp)
     
     def _check_confirmation(self, candle):
-        if not self.retest_candle or len(self.candle_history) < 2:
+        if not self.retest_candle or self._n < 2:
             return
         
-        tol = self.or_range * RETEST_PCT
-        anchor = self.or_high if self.breakout_direction == 'long' else self.or_low
-        band_low = anchor - tol
-        band_high = anchor + tol
+        tol = self._band_tol
+        band_low = self._band_low
+        band_high = self._band_high
         
         # Invalidation
         if self.breakout_direction == 'long' and candle.low < band_low:
@@ -354,42 +500,54 @@ class EntryDetector:
             self._reset_after_invalidation()
             return
         
-        prev = self.candle_history[-2]
+        i = self._n - 2
+        prev_close = self._closes[i]
+        prev_high = self._highs[i]
+        prev_low = self._lows[i]
         cons_low = self.retest_candle.low - tol
         cons_high = self.retest_candle.high + tol
         
-        body_ratio = abs(candle.close - candle.open) / max(candle.high - candle.low, 0.0001)
-        
-        displacement = False
+        # Structural conditions first; the body-ratio division is only
+        # paid on the rare candle that passes them
         if self.breakout_direction == 'long':
-            displacement = (candle.close > cons_high and candle.close > prev.close and
-                          candle.high > prev.high and body_ratio >= 0.30)
+            displacement = (candle.close > cons_high and candle.close > prev_close and
+                          candle.high > prev_high)
         else:
-            displacement = (candle.close < cons_low and candle.close < prev.close and
-                          candle.low < prev.low and body_ratio >= 0.30)
+            displacement = (candle.close < cons_low and candle.close < prev_close and
+                          candle.low < prev_low)
+        
+        if displacement:
+            # Inline conditional expressions skip the abs()/max() builtin
+            # dispatch on this per-candle hot path
+            body = candle.close - candle.open
+            if body < 0.0:
+                body = -body
+            rng = candle.high - candle.low
+            displacement = body / (rng if rng > 0.0001 else 0.0001) >= 0.30
         
         if displacement:
             self.confirmed = True
-            self._generate_signal(candle, model=1)
-            logger.info(f"CONFIRMED Model 1 | Entry: {candle.close:.2f}")
+            self._generate_signal(candle.close, model=1)
+            logger.info("CONFIRMED Model 1 | Entry: %.2f", candle.close)
     
     def _check_fvg(self):
-        for i in range(len(self.candle_history) - FVG_LOOKBACK + 1):
-            block = self.candle_history[i:i + FVG_LOOKBACK]
-            if self.breakout_direction == 'long' and block[0].high < block[-1].low:
-                self.confirmed = True
-                self._generate_signal(block[-1], model=2)
-                logger.info(f"CONFIRMED Model 2 (FVG)")
-                return
-            elif self.breakout_direction == 'short' and block[0].low > block[-1].high:
-                self.confirmed = True
-                self._generate_signal(block[-1], model=2)
-                logger.info(f"CONFIRMED Model 2 (FVG)")
-                return
+        n = self._n
+        # Only the newest triplet can form a new gap once this check runs
+        # every candle; the first call does one catch-up scan over the
+        # full history, the steady state is O(1)
+        start = 0
+        if self._fvg_scanned_once:
+            start = max(n - FVG_LOOKBACK, 0)
+        self._fvg_scanned_once = True
+        hit = _fvg_scan(self._highs[start:n], self._lows[start:n],
+                        self.breakout_direction == 'long', FVG_LOOKBACK)
+        if hit >= 0:
+            hit += start
+            self.confirmed = True
+            self._generate_signal(float(self._closes[hit]), model=2)
+            logger.info("CONFIRMED Model 2 (FVG)")
     
-    def _generate_signal(self, candle, model):
-        entry = candle.close
-        
+    def _generate_signal(self, entry, model):
         if model == 1 and self.retest_candle:
             if self.breakout_direction == 'long':
                 sl = self.retest_candle.low
@@ -402,8 +560,9 @@ class EntryDetector:
                     sl = entry + 0.50
                 tp = entry - (2 * (sl - entry))
         else:
-            recent = self.candle_history[-14:]
-            atr = sum(c.high - c.low for c in recent) / len(recent)
+            n = self._n
+            start = max(n - 14, 0)
+            atr = _atr(self._highs[start:n], self._lows[start:n])
             sl_dist = 0.8 * atr
             if self.breakout_direction == 'long':
                 sl = entry - sl_dist
@@ -412,12 +571,17 @@ class EntryDetector:
                 sl = entry + sl_dist
                 tp = entry - (2 * sl_dist)
         
+        # Prices are formatted once here; place_order and the log sites
+        # reuse the strings instead of re-running float __format__
         self.entry_signal = {
             'model': model,
             'direction': self.breakout_direction,
             'entry_price': entry,
             'sl': sl,
-            'tp': tp
+            'tp': tp,
+            'entry_str': format(entry, '.2f'),
+            'sl_str': format(sl, '.2f'),
+            'tp_str': format(tp, '.2f')
         }
 
 # ============================================================================
@@ -427,7 +591,7 @@ class EntryDetector:
 class OandaExecutor:
     """Execute trades via OANDA."""
     def __init__(self, dry_run=False):
-        self.client = oandapyV20.API(access_token=OANDA_ACCESS_TOKEN)
+        self.client = _client()
         self.dry_run = dry_run
         self.current_position = None
         logger.info(f"Executor initialized (dry_run={dry_run})")
@@ -435,14 +599,12 @@ class OandaExecutor:
     def place_order(self, signal):
         """Place market order with SL/TP."""
         direction = signal['direction']
-        entry = signal['entry_price']
-        sl = signal['sl']
-        tp = signal['tp']
         
         units = UNITS if direction == 'long' else -UNITS
         
         logger.info(f"{'[DRY RUN] ' if self.dry_run else ''}Placing {direction.upper()} order:")
-        logger.info(f"  Entry: {entry:.2f} | SL: {sl:.2f} | TP: {tp:.2f}")
+        logger.info("  Entry: %s | SL: %s | TP: %s",
+                    signal['entry_str'], signal['sl_str'], signal['tp_str'])
         
         if self.dry_run:
             self.current_position = signal
@@ -454,8 +616,8 @@ class OandaExecutor:
                     "instrument": INSTRUMENT,
                     "units": str(units),
                     "type": "MARKET",
-                    "stopLossOnFill": {"price": f"{sl:.2f}"},
-                    "takeProfitOnFill": {"price": f"{tp:.2f}"}
+                    "stopLossOnFill": {"price": signal['sl_str']},
+                    "takeProfitOnFill": {"price": signal['tp_str']}
                 }
             }
             
@@ -476,35 +638,65 @@ class OandaExecutor:
 # DATA FETCHER
 # ============================================================================
 
-def fetch_recent_candles(instrument, granularity, count=100):
-    """Fetch recent candles from OANDA."""
-    client = oandapyV20.API(access_token=OANDA_ACCESS_TOKEN)
+# Module-level API client shared by all fetches; recreating one per poll
+# would redo the TCP+TLS handshake every minute
+_API_CLIENT = None
+
+
+def _client():
+    global _API_CLIENT
+    if _API_CLIENT is None:
+        _API_CLIENT = oandapyV20.API(access_token=OANDA_ACCESS_TOKEN)
+    return _API_CLIENT
+
+
+def fetch_recent_candles(instrument, granularity, count=100, from_time=None):
+    """Fetch recent candles from OANDA.
     
-    params = {
-        "granularity": granularity,
-        "count": count,
-        "price": "M"
-    }
+    When from_time (RFC3339 string) is given, only candles from that
+    timestamp onward are requested instead of re-downloading the full
+    count window on every poll.
+    """
+    client = _client()
+    
+    if from_time is not None:
+        params = {
+            "granularity": granularity,
+            "from": from_time,
+            "price": "M"
+        }
+    else:
+        params = {
+            "granularity": granularity,
+            "count": count,
+            "price": "M"
+        }
     
     r = instruments.InstrumentsCandles(instrument=instrument, params=params)
     client.request(r)
     
-    candles = []
-    for c in r.response.get("candles", []):
-        ny_tz = pytz.timezone('America/New_York')
-        timestamp = pd.to_datetime(c["time"]).tz_convert(ny_tz)
-        
-        candle = Candle(
-            timestamp=timestamp,
-            open_price=float(c["mid"]["o"]),
-            high=float(c["mid"]["h"]),
-            low=float(c["mid"]["l"]),
-            close=float(c["mid"]["c"]),
-            volume=int(c["volume"])
-        )
-        candles.append(candle)
+    raw = r.response.get("candles", [])
+    n = len(raw)
+    if n == 0:
+        empty = np.empty(0)
+        return CandleBatch(pd.DatetimeIndex([], tz=_NY_TZ),
+                           np.empty(0, dtype=np.int64),
+                           empty, empty, empty, empty,
+                           np.empty(0, dtype=np.int64))
+    
+    # One vectorized parse + tz-convert for all timestamps, using the
+    # module-level timezone, instead of per-candle pd.to_datetime calls
+    times = pd.to_datetime([c["time"] for c in raw]).tz_convert(_NY_TZ)
+    
+    # One C-level fromiter pass per field instead of five Python-level
+    # float()/int() calls per candle
+    o = np.fromiter((c["mid"]["o"] for c in raw), dtype=np.float64, count=n)
+    h = np.fromiter((c["mid"]["h"] for c in raw), dtype=np.float64, count=n)
+    l = np.fromiter((c["mid"]["l"] for c in raw), dtype=np.float64, count=n)
+    cl = np.fromiter((c["mid"]["c"] for c in raw), dtype=np.float64, count=n)
+    vol = np.fromiter((c["volume"] for c in raw), dtype=np.int64, count=n)
     
-    return candles
+    return CandleBatch(times, times.asi8 // 1_000_000_000, o, h, l, cl, vol)
 
 # ============================================================================
 # MAIN LIVE TRADER
@@ -527,8 +719,10 @@ def main(dry_run=True):
     entry_detector = EntryDetector()
     executor = OandaExecutor(dry_run=dry_run)
     
-    # Track processed candles
-    processed_1m = set()
+    # Candles arrive in time order, so a single cursor deduplicates them;
+    # no per-candle tuple hashing, no set growing for the whole session
+    last_seen_ts = None
+    last_fetch_from = None
     
     try:
         while True:
@@ -538,8 +732,16 @@ def main(dry_run=True):
                 time.sleep(300)  # Check every 5 minutes
                 continue
             
-            # Fetch recent candles (optimized: only fetch what we need)
-            candles_1m = fetch_recent_candles(INSTRUMENT, "M1", count=CANDLE_FETCH_COUNT)
+            # First poll seeds with a count window; afterwards fetch
+            # incrementally from the last seen candle so each poll
+            # downloads and parses only one or two new candles
+            if last_fetch_from is None:
+                candles_1m = fetch_recent_candles(INSTRUMENT, "M1", count=CANDLE_FETCH_COUNT)
+            else:
+                candles_1m = fetch_recent_candles(INSTRUMENT, "M1", from_time=last_fetch_from)
+            if len(candles_1m.ts_epoch) > 0:
+                last_fetch_from = time.strftime(
+                    '%Y-%m-%dT%H:%M:%SZ', time.gmtime(int(candles_1m.ts_epoch[-1])))
             candles_5m = fetch_recent_candles(INSTRUMENT, "M5", count=10)
             
             # Update session state
@@ -550,37 +752,60 @@ def main(dry_run=True):
                 logger.info("Session closed - stopping")
                 break
             
-            # Process new 1m candles
+            # Process new 1m candles; a Candle object is materialized
+            # only for candles past the cursor (at most one per minute)
             if session_state.can_trade():
-                for candle in candles_1m:
-                    candle_id = (candle.timestamp, candle.close)
+                n_batch = len(candles_1m.ts_epoch)
+                start = 0
+                if last_seen_ts is not None:
+                    start = int(np.searchsorted(
+                        candles_1m.ts_epoch, last_seen_ts, side='right'))
+                if start < n_batch:
+                    last_seen_ts = int(candles_1m.ts_epoch[-1])
+                    # Before the first breakout, skip pre-breakout rows of
+                    # a catch-up batch with one vectorized scan instead of
+                    # one process_candle call each
+                    if not entry_detector.breakout_seen and \
+                            not entry_detector.confirmed and \
+                            not entry_detector.invalidated:
+                        start = entry_detector.bulk_prebreakout(
+                            candles_1m, start,
+                            session_state.or_high, session_state.or_low)
+                for i in range(start, n_batch):
+                    candle = Candle(
+                        timestamp=candles_1m.times[i],
+                        open_price=float(candles_1m.open[i]),
+                        high=float(candles_1m.high[i]),
+                        low=float(candles_1m.low[i]),
+                        close=float(candles_1m.close[i]),
+                        volume=int(candles_1m.volume[i])
+                    )
+                    signal = entry_detector.process_candle(
+                        candle, 
+                        session_state.or_high, 
+                        session_state.or_low
+                    )
                     
-                    if candle_id not in processed_1m:
-                        processed_1m.add(candle_id)
-                        
-                        signal = entry_detector.process_candle(
-                            candle, 
-                            session_state.or_high, 
-                            session_state.or_low
-                        )
+                    if signal:
+                        logger.info("=" * 60)
+                        logger.info("📊 ENTRY SIGNAL!")
+                        logger.info("   Model: %s", signal['model'])
+                        logger.info("   Direction: %s", signal['direction'].upper())
+                        logger.info("   Entry: %s", signal['entry_str'])
+                        logger.info("=" * 60)
                         
-                        if signal:
-                            logger.info("=" * 60)
-                            logger.info("📊 ENTRY SIGNAL!")
-                            logger.info(f"   Model: {signal['model']}")
-                            logger.info(f"   Direction: {signal['direction'].upper()}")
-                            logger.info(f"   Entry: {signal['entry_price']:.2f}")
-                            logger.info("=" * 60)
-                            
-                            if executor.place_order(signal):
-                                session_state.mark_trade_taken()
-                                entry_detector.reset()  # Reset detector after trade
-                                logger.info("✅ Trade executed - session ended")
-                                return
+                        if executor.place_order(signal):
+                            session_state.mark_trade_taken()
+                            entry_detector.reset()  # Reset detector after trade
+                            logger.info("✅ Trade executed - session ended")
+                            return
             
-            # Wait before next poll
-            logger.info(f"State: {session_state.state.value} | Waiting {POLL_INTERVAL}s...")
-            time.sleep(POLL_INTERVAL)
+            # Sleep to just past the next minute boundary so each poll
+            # wakes right after a 1m candle closes, instead of drifting
+            # against candle closes with a fixed interval
+            delay = 60.0 - (time.time() % 60.0) + 1.0
+            logger.info("State: %s | Waiting %.0fs...", session_state.state.value, delay)
+            time.sleep(delay)
     
     except KeyboardInterrupt:
         logger.info("\n⚠️  Stopped by user")
@@ -4,6 +4,8 @@ Copyright (c) 2026 Rignesh
 Licensed under the MIT License - see LICENSE file for details
 """
 
+import threading
+
 from utils import setup_logging
 from candle_buffer import CandleBuffer
 from session_state import SessionStateMachine
@@ -16,6 +18,8 @@ def main():
 
     buffer = CandleBuffer()
     session = SessionStateMachine()
+    # Feed closing 5m candles straight into the OR accumulator
+    buffer.on_new_5m = session.on_new_5m_candle
     detector = EntryDetector()
     executor = OandaExecutor(dry_run=True)
 
@@ -32,8 +36,10 @@ def main():
 
         candle = candles[-1]
         or_high, or_low = session.get_or_range()
+        if or_high != detector.or_high or or_low != detector.or_low:
+            detector.set_or_range(or_high, or_low)
 
-        signal = detector.process_candle(candle, or_high, or_low)
+        signal = detector.process_candle(candle)
 
         if signal and not executor.has_position():
             ok = executor.place_order(signal)
@@ -45,9 +51,10 @@ def main():
 
     logger.info("🚀 Live trader started")
 
+    # Block without spinning; all work happens on the stream callback
+    stop_event = threading.Event()
     try:
-        while True:
-            pass
+        stop_event.wait()
     except KeyboardInterrupt:
         logger.info("Shutting down...")
         stream.stop()
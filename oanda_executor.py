@@ -40,6 +40,18 @@ class OandaExecutor:
         self.current_position = None
         self.order_id = None
         
+        # Reusable order request; place_order fills in the three dynamic
+        # fields instead of rebuilding the nested dicts per order
+        self._order_template = {
+            "order": {
+                "instrument": self.instrument,
+                "units": "",
+                "type": "MARKET",
+                "stopLossOnFill": {"price": ""},
+                "takeProfitOnFill": {"price": ""}
+            }
+        }
+        
         logger.info(f"OandaExecutor initialized (dry_run={dry_run})")
     
     def place_order(self, signal):
@@ -47,7 +59,7 @@ class OandaExecutor:
         Place market order with SL and TP attached.
         
         Args:
-            signal (dict): Entry signal from detector
+            signal (EntrySignal): Entry signal from detector
                 - direction: 'long' or 'short'
                 - entry_price: Expected entry price
                 - sl: Stop loss price
@@ -56,28 +68,20 @@ class OandaExecutor:
         Returns:
             bool: True if order placed successfully
         """
-        direction = signal['direction']
-        entry_price = signal['entry_price']
-        sl = signal['sl']
-        tp = signal['tp']
+        direction = signal.direction
+        entry_price = signal.entry_price
+        sl = signal.sl
+        tp = signal.tp
         
         # Calculate units (positive for long, negative for short)
         units_signed = self.units if direction == 'long' else -self.units
         
-        # Build order request
-        order_data = {
-            "order": {
-                "instrument": self.instrument,
-                "units": str(units_signed),
-                "type": "MARKET",
-                "stopLossOnFill": {
-                    "price": f"{sl:.2f}"
-                },
-                "takeProfitOnFill": {
-                    "price": f"{tp:.2f}"
-                }
-            }
-        }
+        # Fill the reusable order request
+        order_data = self._order_template
+        order = order_data["order"]
+        order["units"] = str(units_signed)
+        order["stopLossOnFill"]["price"] = f"{sl:.2f}"
+        order["takeProfitOnFill"]["price"] = f"{tp:.2f}"
         
         logger.info(f"{'[DRY RUN] ' if self.dry_run else ''}Placing {direction.upper()} order:")
         logger.info(f"  Entry: {entry_price:.2f}")
@@ -11,21 +11,23 @@ Manages trading session states and Opening Range detection.
 
 import datetime
 import logging
-from enum import Enum
+import time
+from enum import IntEnum
 
-from utils import get_ny_time
-from config import SESSION_START, OR_LOCK_TIME, SESSION_END, ENABLE_OR_FILTER, MIN_OR_RANGE, MAX_OR_RANGE
+from utils import get_ny_time, precompute_session_boundaries
+from candle_buffer import NY_TZ
+from config import ENABLE_OR_FILTER, MIN_OR_RANGE, MAX_OR_RANGE
 
 logger = logging.getLogger(__name__)
 
 
-class SessionState(Enum):
-    """Trading session states."""
-    PRE_OR = "PRE_OR"  # Before 09:30 NY
-    OR_BUILDING = "OR_BUILDING"  # 09:30-09:34 NY, collecting OR candles
-    OR_LOCKED = "OR_LOCKED"  # 09:35 NY, OR range finalized
-    POST_OR_TRADING = "POST_OR_TRADING"  # After 09:35, monitoring for entries
-    SESSION_CLOSED = "SESSION_CLOSED"  # Trade taken or after 16:00
+class SessionState(IntEnum):
+    """Trading session states (IntEnum so per-tick == is an int compare)."""
+    PRE_OR = 0  # Before 09:30 NY
+    OR_BUILDING = 1  # 09:30-09:34 NY, collecting OR candles
+    OR_LOCKED = 2  # 09:35 NY, OR range finalized
+    POST_OR_TRADING = 3  # After 09:35, monitoring for entries
+    SESSION_CLOSED = 4  # Trade taken or after 16:00
 
 
 class SessionStateMachine:
@@ -42,6 +44,46 @@ class SessionStateMachine:
         self.or_close_time = None
         self.trade_taken = False
         self.current_date = None
+
+        # Cached can_trade() answer; every input to it changes only via
+        # _transition_to or the day reset, so it is recomputed there and
+        # the per-tick query is a single attribute load
+        self._can_trade = False
+
+        # Reusable snapshot returned by get_state_info(); mutated in
+        # place at the same points _can_trade is refreshed, so polling
+        # it does not allocate a dict per call
+        self._state_info = {
+            'state': self.state.name,
+            'or_high': None,
+            'or_low': None,
+            'trade_taken': False,
+            'can_trade': False,
+        }
+
+        # Session boundaries as epoch seconds, set once per day; the
+        # per-tick update then compares plain time.time() floats
+        self._session_start_epoch = None
+        self._or_lock_epoch = None
+        self._session_end_epoch = None
+        self._next_day_epoch = None
+
+        # Streaming OR accumulators, fed by CandleBuffer.on_new_5m so the
+        # range is ready at lock time without rescanning the 5m series
+        self._or_window_lo = None
+        self._or_window_hi = None
+        self._or_running_high = None
+        self._or_running_low = None
+        self._or_first_ts = None
+        self._or_last_ts = None
+
+        # O(1) state dispatch; SESSION_CLOSED has no handler on purpose
+        self._handlers = {
+            SessionState.PRE_OR: self._handle_pre_or,
+            SessionState.OR_BUILDING: self._handle_or_building,
+            SessionState.OR_LOCKED: self._handle_or_locked,
+            SessionState.POST_OR_TRADING: self._handle_post_or_trading,
+        }
         
         logger.info("SessionStateMachine initialized in PRE_OR state")
     
@@ -52,30 +94,20 @@ class SessionStateMachine:
         Args:
             candle_buffer (CandleBuffer): Buffer containing candles
         """
-        ny_time = get_ny_time()
-        current_time = ny_time.time()
-        current_date = ny_time.date()
-        
-        # Reset state machine for new day
-        if self.current_date != current_date:
-            self._reset_for_new_day(current_date)
+        now = time.time()
         
-        # State transitions
-        if self.state == SessionState.PRE_OR:
-            self._handle_pre_or(current_time)
+        # Day rollover: only this rare path allocates tz-aware datetimes
+        if self._next_day_epoch is None or now >= self._next_day_epoch:
+            self._reset_for_new_day(get_ny_time().date())
         
-        elif self.state == SessionState.OR_BUILDING:
-            self._handle_or_building(current_time, candle_buffer)
-        
-        elif self.state == SessionState.OR_LOCKED:
-            self._handle_or_locked()
-        
-        elif self.state == SessionState.POST_OR_TRADING:
-            self._handle_post_or_trading(current_time)
+        # State transitions: single dict lookup instead of an if/elif walk
+        handler = self._handlers.get(self.state)
+        if handler is not None:
+            handler(now, candle_buffer)
     
     def _reset_for_new_day(self, new_date):
         """Reset state for a new trading day."""
-        logger.info(f"Resetting state machine for new day: {new_date}")
+        logger.info("Resetting state machine for new day: %s", new_date)
         self.state = SessionState.PRE_OR
         self.or_high = None
         self.or_low = None
@@ -83,55 +115,98 @@ class SessionStateMachine:
         self.or_close_time = None
         self.trade_taken = False
         self.current_date = new_date
+        self._can_trade = False
+        self._refresh_state_info()
+
+        (self._session_start_epoch, self._or_lock_epoch,
+         self._session_end_epoch, self._next_day_epoch) = \
+            precompute_session_boundaries(new_date)
+
+        # Epoch bounds of today's OR window (5m candle start times)
+        self._or_window_lo = int(self._session_start_epoch)
+        self._or_window_hi = self._or_window_lo + 300
+        self._or_running_high = None
+        self._or_running_low = None
+        self._or_first_ts = None
+        self._or_last_ts = None
     
-    def _handle_pre_or(self, current_time):
+    def _handle_pre_or(self, now, candle_buffer):
         """Handle PRE_OR state - waiting for session start."""
-        session_start = datetime.time(9, 30)
-        
-        if current_time >= session_start:
+        if now >= self._session_start_epoch:
             self._transition_to(SessionState.OR_BUILDING)
     
-    def _handle_or_building(self, current_time, candle_buffer):
+    def on_new_5m_candle(self, ts_epoch, high, low):
+        """
+        Streaming hook for CandleBuffer.on_new_5m: fold 5m candles inside
+        the OR window into running high/low scalars as they close.
+        """
+        lo = self._or_window_lo
+        if lo is None or not (lo <= ts_epoch < self._or_window_hi):
+            return
+        if self._or_running_high is None or high > self._or_running_high:
+            self._or_running_high = high
+        if self._or_running_low is None or low < self._or_running_low:
+            self._or_running_low = low
+        if self._or_first_ts is None:
+            self._or_first_ts = ts_epoch
+        self._or_last_ts = ts_epoch
+    
+    def _handle_or_building(self, now, candle_buffer):
         """Handle OR_BUILDING state - collecting OR candles."""
-        or_lock = datetime.time(9, 35)
-        
-        if current_time >= or_lock:
-            # Calculate OR high/low from 5m candles
-            or_candles = candle_buffer.get_or_candles()
-            
-            if len(or_candles) > 0:
-                self.or_high = max(c.high for c in or_candles)
-                self.or_low = min(c.low for c in or_candles)
-                self.or_open_time = or_candles[0].timestamp
-                self.or_close_time = or_candles[-1].timestamp
+        if now >= self._or_lock_epoch:
+            if self._or_running_high is not None:
+                # OR maintained incrementally by the on_new_5m hook
+                self.or_high = self._or_running_high
+                self.or_low = self._or_running_low
+                self.or_open_time = datetime.datetime.fromtimestamp(
+                    self._or_first_ts, tz=NY_TZ)
+                self.or_close_time = datetime.datetime.fromtimestamp(
+                    self._or_last_ts, tz=NY_TZ)
                 
                 or_range = self.or_high - self.or_low
+                self._check_or_filters_and_lock(or_range)
+                return
+            
+            # Fallback: hook not wired (or started mid-window); one
+            # vectorized reduction over the buffer's 5m arrays instead of
+            # generator max/min over materialized Candle objects
+            or_highs, or_lows, or_ts = candle_buffer.get_or_highs_lows()
+            
+            if or_highs.size > 0:
+                self.or_high = float(or_highs.max())
+                self.or_low = float(or_lows.min())
+                self.or_open_time = datetime.datetime.fromtimestamp(
+                    int(or_ts[0]), tz=NY_TZ)
+                self.or_close_time = datetime.datetime.fromtimestamp(
+                    int(or_ts[-1]), tz=NY_TZ)
                 
-                # Check OR range filters
-                if ENABLE_OR_FILTER:
-                    if or_range < MIN_OR_RANGE:
-                        logger.warning(f"OR range too small ({or_range:.2f} < {MIN_OR_RANGE}) - skipping trading today")
-                        self._transition_to(SessionState.SESSION_CLOSED)
-                        return
-                    if or_range > MAX_OR_RANGE:
-                        logger.warning(f"OR range too large ({or_range:.2f} > {MAX_OR_RANGE}) - skipping trading today")
-                        self._transition_to(SessionState.SESSION_CLOSED)
-                        return
-                
-                logger.info(f"OR LOCKED at 09:35 | High: {self.or_high:.2f} | Low: {self.or_low:.2f} | Range: {or_range:.2f}")
-                self._transition_to(SessionState.OR_LOCKED)
+                or_range = self.or_high - self.or_low
+                self._check_or_filters_and_lock(or_range)
             else:
                 logger.warning("No OR candles found at 09:35, staying in OR_BUILDING")
     
-    def _handle_or_locked(self):
+    def _check_or_filters_and_lock(self, or_range):
+        """Apply the OR range filters and lock (or close) the session."""
+        if ENABLE_OR_FILTER:
+            if or_range < MIN_OR_RANGE:
+                logger.warning("OR range too small (%.2f < %s) - skipping trading today", or_range, MIN_OR_RANGE)
+                self._transition_to(SessionState.SESSION_CLOSED)
+                return
+            if or_range > MAX_OR_RANGE:
+                logger.warning("OR range too large (%.2f > %s) - skipping trading today", or_range, MAX_OR_RANGE)
+                self._transition_to(SessionState.SESSION_CLOSED)
+                return
+        
+        logger.info("OR LOCKED at 09:35 | High: %.2f | Low: %.2f | Range: %.2f", self.or_high, self.or_low, or_range)
+        self._transition_to(SessionState.OR_LOCKED)
+    
+    def _handle_or_locked(self, now, candle_buffer):
         """Handle OR_LOCKED state - immediately transition to trading."""
         self._transition_to(SessionState.POST_OR_TRADING)
     
-    def _handle_post_or_trading(self, current_time):
+    def _handle_post_or_trading(self, now, candle_buffer):
         """Handle POST_OR_TRADING state - check for session end."""
-        session_end = datetime.time(16, 0)
-        
-        if current_time >= session_end:
+        if now >= self._session_end_epoch:
             logger.info("Session ended at 16:00 NY time")
             self._transition_to(SessionState.SESSION_CLOSED)
     
@@ -139,7 +214,21 @@ class SessionStateMachine:
         """Transition to a new state."""
         old_state = self.state
         self.state = new_state
-        logger.info(f"State transition: {old_state.value} -> {new_state.value}")
+        self._can_trade = (new_state == SessionState.POST_OR_TRADING and
+                           not self.trade_taken and
+                           self.or_high is not None and
+                           self.or_low is not None)
+        self._refresh_state_info()
+        logger.info("State transition: %s -> %s", old_state.name, new_state.name)
+
+    def _refresh_state_info(self):
+        """Sync the reusable get_state_info() snapshot with current state."""
+        info = self._state_info
+        info['state'] = self.state.name
+        info['or_high'] = self.or_high
+        info['or_low'] = self.or_low
+        info['trade_taken'] = self.trade_taken
+        info['can_trade'] = self._can_trade
     
     def mark_trade_taken(self):
         """Mark that a trade has been taken (one per session)."""
@@ -154,10 +243,7 @@ class SessionStateMachine:
         Returns:
             bool: True if in POST_OR_TRADING state and no trade taken
         """
-        return (self.state == SessionState.POST_OR_TRADING and 
-                not self.trade_taken and 
-                self.or_high is not None and 
-                self.or_low is not None)
+        return self._can_trade
     
     def get_or_range(self):
         """
@@ -171,14 +257,8 @@ class SessionStateMachine:
     def get_state_info(self):
         """
         Get current state information for logging.
-        
+
         Returns:
-            dict: State information
+            dict: State information (shared snapshot - treat as read-only)
         """
-        return {
-            'state': self.state.value,
-            'or_high': self.or_high,
-            'or_low': self.or_low,
-            'trade_taken': self.trade_taken,
-            'can_trade': self.can_trade()
-        }
+        return self._state_info
@@ -11,16 +11,53 @@ Connects to OANDA streaming API and publishes real-time ticks.
 
 import oandapyV20
 from oandapyV20.endpoints import pricing
+import calendar
 import logging
 import time
 from threading import Thread, Event
-from datetime import datetime
-import pytz
+
+import numpy as np
 
 from config import OANDA_ACCESS_TOKEN, OANDA_ACCOUNT_ID, INSTRUMENT
 
 logger = logging.getLogger(__name__)
 
+# Tick batching: flush to the batch callback when this many ticks have
+# accumulated or the oldest buffered tick is this old, whichever first
+_BATCH_CAPACITY = 256
+_BATCH_MAX_AGE = 0.25  # seconds
+
+# Midnight epoch for the last-seen UTC date string, so the per-tick parser
+# only does hour/minute/second arithmetic between day changes
+_day_cache = ('', 0)
+
+
+def _parse_oanda_ts(s):
+    """
+    Parse an OANDA RFC3339 UTC timestamp to float epoch seconds.
+
+    Fixed-offset field extraction ('2026-01-02T21:59:05.222899102Z' or
+    ...+00:00) — no split/replace/fromisoformat and no datetime object
+    per tick. Fractional digits are folded in up to nanoseconds.
+    """
+    global _day_cache
+    day = s[:10]
+    cached_day, base = _day_cache
+    if day != cached_day:
+        base = calendar.timegm(
+            (int(s[0:4]), int(s[5:7]), int(s[8:10]), 0, 0, 0, 0, 0, 0))
+        _day_cache = (day, base)
+
+    sec = base + int(s[11:13]) * 3600 + int(s[14:16]) * 60 + int(s[17:19])
+
+    if len(s) > 19 and s[19] == '.':
+        # OANDA only ever suffixes 'Z' or '+00:00'; slicing the digits in
+        # one piece turns the fraction into a single int() call
+        digits = s[20:-1] if s[-1] == 'Z' else s[20:-6]
+        return sec + int(digits) / 10.0 ** len(digits)
+
+    return float(sec)
+
 
 class StreamingClient:
     """
@@ -28,23 +65,50 @@ class StreamingClient:
     Subscribes to real-time prices and publishes ticks to callback.
     """
     
-    def __init__(self, on_tick_callback):
+    def __init__(self, on_tick_callback, is_active_callback=None,
+                 on_tick_batch_callback=None):
         """
         Initialize streaming client.
         
         Args:
             on_tick_callback (callable): Function to call with each tick
-                                        Signature: on_tick_callback(timestamp, bid, ask)
+                                        Signature: on_tick_callback(ts_epoch, bid, ask)
+                                        where ts_epoch is float epoch seconds (UTC)
+            is_active_callback (callable): Optional zero-arg gate; when it
+                                        returns False, price messages are
+                                        dropped before any parsing
+            on_tick_batch_callback (callable): Optional batch consumer,
+                                        called as (ts_arr, bid_arr, ask_arr)
+                                        with parallel numpy arrays; when
+                                        set, it replaces the per-tick
+                                        callback
         """
         self.client = oandapyV20.API(access_token=OANDA_ACCESS_TOKEN)
         self.account_id = OANDA_ACCOUNT_ID
         self.instrument = INSTRUMENT
         self.on_tick_callback = on_tick_callback
+        self.is_active_callback = is_active_callback
+        self.on_tick_batch_callback = on_tick_batch_callback
+        
+        if on_tick_batch_callback is not None:
+            # Preallocated parallel arrays; _process_price writes three
+            # floats per tick and downstream work is amortized per batch
+            self._batch_ts = np.empty(_BATCH_CAPACITY, dtype=np.float64)
+            self._batch_bid = np.empty(_BATCH_CAPACITY, dtype=np.float64)
+            self._batch_ask = np.empty(_BATCH_CAPACITY, dtype=np.float64)
+            self._batch_n = 0
+            self._batch_deadline = 0.0
         
         self.running = False
         self.stop_event = Event()
         self.stream_thread = None
         
+        # Endpoint built once; reconnects reuse it instead of redoing the
+        # URL templating and param encoding every time
+        self._pricing_req = pricing.PricingStream(
+            accountID=self.account_id,
+            params={"instruments": self.instrument})
+        
         logger.info(f"StreamingClient initialized for {INSTRUMENT}")
     
     def start(self):
@@ -79,20 +143,20 @@ class StreamingClient:
             try:
                 self._connect_and_stream()
             except Exception as e:
-                logger.error(f"Streaming error: {e}")
+                # Errors raised by a stop()-initiated teardown are not
+                # worth reporting; reconnect only while still running
                 if self.running:
+                    logger.error("Streaming error: %s", e)
                     logger.info("Reconnecting in 5 seconds...")
-                    time.sleep(5)
+                    # Interruptible backoff: stop() wakes this immediately
+                    # instead of blocking a full 5s in time.sleep
+                    self.stop_event.wait(5)
     
     def _connect_and_stream(self):
         """Connect to OANDA and process stream."""
-        params = {
-            "instruments": self.instrument
-        }
-        
-        r = pricing.PricingStream(accountID=self.account_id, params=params)
+        r = self._pricing_req
         
-        logger.info(f"Connecting to OANDA stream for {self.instrument}...")
+        logger.info("Connecting to OANDA stream for %s...", self.instrument)
         
         try:
             # OANDA API returns messages directly (not as tuples)
@@ -103,13 +167,21 @@ class StreamingClient:
                 # Check message type
                 msg_type = msg.get('type', '')
                 
-                # Process price messages
+                # Process price messages; when the consumer declares
+                # itself inactive (outside the session), drop the tick
+                # before paying for any parsing
                 if msg_type == 'PRICE':
+                    active = self.is_active_callback
+                    if active is not None and not active():
+                        continue
                     self._process_price(msg)
-                
-        except Exception as e:
-            if self.running:
-                raise e
+                elif self.on_tick_batch_callback is not None:
+                    # Heartbeats and other messages bound the batch age
+                    # even when no new prices arrive
+                    self._flush_ticks()
+        finally:
+            if self.on_tick_batch_callback is not None:
+                self._flush_ticks()
     
     def _process_price(self, price_msg):
         """
@@ -132,24 +204,38 @@ class StreamingClient:
             bid = float(bids[0]['price'])
             ask = float(asks[0]['price'])
             
-            # Parse timestamp
-            # OANDA timestamps are in RFC3339 format with nanosecond precision
-            # Python's fromisoformat only handles up to microseconds
-            # Truncate to microseconds: '2026-01-02T21:59:05.222899102+00:00' -> '2026-01-02T21:59:05.222899+00:00'
-            if '.' in timestamp:
-                parts = timestamp.split('.')
-                # Keep only first 6 digits after decimal (microseconds)
-                fractional = parts[1][:6]
-                timezone_part = parts[1][parts[1].find('+'):]  # Get +00:00 part
-                timestamp = f"{parts[0]}.{fractional}{timezone_part}"
+            # Fixed-offset epoch parse; OANDA's nanosecond RFC3339 strings
+            # never touch fromisoformat (which also can't take 9 digits)
+            ts = _parse_oanda_ts(timestamp)
             
-            ts = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+            if self.on_tick_batch_callback is not None:
+                # Batch mode: three array writes per tick, one Python
+                # call per flushed batch
+                n = self._batch_n
+                if n == 0:
+                    self._batch_deadline = time.monotonic() + _BATCH_MAX_AGE
+                self._batch_ts[n] = ts
+                self._batch_bid[n] = bid
+                self._batch_ask[n] = ask
+                self._batch_n = n + 1
+                if (self._batch_n == _BATCH_CAPACITY
+                        or time.monotonic() >= self._batch_deadline):
+                    self._flush_ticks()
+                return
             
             # Call the callback with tick data
             self.on_tick_callback(ts, bid, ask)
             
         except Exception as e:
-            logger.error(f"Error processing price: {e}")
+            logger.error("Error processing price: %s", e)
+    
+    def _flush_ticks(self):
+        """Hand any buffered ticks to the batch callback."""
+        n = self._batch_n
+        if n:
+            self._batch_n = 0
+            self.on_tick_batch_callback(
+                self._batch_ts[:n], self._batch_bid[:n], self._batch_ask[:n])
     
     def is_running(self):
         """Check if streaming is active."""
@@ -9,9 +9,21 @@ Utility functions for live trading system
 """
 
 import datetime
-import pytz
+import time
+from zoneinfo import ZoneInfo
 import logging
-from config import LOG_FILE, LOG_LEVEL, LOG_TICK_DATA
+import logging.handlers
+from config import (LOG_FILE, LOG_LEVEL, LOG_TICK_DATA,
+                    SESSION_START, OR_LOCK_TIME, SESSION_END)
+
+# Cached timezone and session bounds (looked up on every loop iteration);
+# zoneinfo matches candle_buffer.NY_TZ and avoids pytz's normalize step
+_NY_TZ = ZoneInfo('America/New_York')
+_SESSION_START = datetime.time(9, 30)
+
+# is_market_open day cache: (start_epoch, end_epoch, is_weekday,
+# next_day_epoch), refreshed on NY date rollover
+_market_day_cache = (0.0, 0.0, False, 0.0)
 
 
 def get_ny_time():
@@ -21,29 +33,56 @@ def get_ny_time():
     Returns:
         datetime: Current time in America/New_York timezone
     """
-    ny_tz = pytz.timezone('America/New_York')
-    return datetime.datetime.now(ny_tz)
+    return datetime.datetime.now(_NY_TZ)
 
 
 def is_market_open():
     """
     Check if market is currently open for trading.
     
+    The session bounds are cached as epoch seconds and refreshed only on
+    NY date rollover, so the steady-state answer is two float compares
+    with no datetime construction at all.
+    
     Returns:
         bool: True if within trading hours (09:30-16:00 NY time)
     """
-    ny_time = get_ny_time()
-    current_time = ny_time.time()
+    global _market_day_cache
+    now = time.time()
+    start, end, weekday_ok, next_day = _market_day_cache
+    if now >= next_day:
+        ny_now = datetime.datetime.now(_NY_TZ)
+        start, _, end, next_day = precompute_session_boundaries(ny_now.date())
+        weekday_ok = ny_now.weekday() < 5  # Monday=0 .. Friday=4
+        _market_day_cache = (start, end, weekday_ok, next_day)
+    return weekday_ok and start <= now <= end
+
+
+def precompute_session_boundaries(date):
+    """
+    Compute the day's session boundaries as UTC epoch seconds.
+    
+    Building the NY-localized datetimes once per day lets hot paths
+    compare plain time.time() floats instead of allocating tz-aware
+    datetime objects per tick.
     
-    # Check if weekday (Monday=0, Sunday=6)
-    if ny_time.weekday() >= 5:  # Saturday or Sunday
-        return False
+    Args:
+        date (datetime.date): Trading day (NY calendar date)
+        
+    Returns:
+        tuple: (session_start, or_lock, session_end, next_day) epochs
+    """
+    def _epoch(hhmm):
+        hour, minute = map(int, hhmm.split(':'))
+        return datetime.datetime.combine(
+            date, datetime.time(hour, minute), tzinfo=_NY_TZ).timestamp()
     
-    # Check if within trading hours
-    start = datetime.time(9, 30)
-    end = datetime.time(16, 0)
+    next_day = datetime.datetime.combine(
+        date + datetime.timedelta(days=1), datetime.time(0, 0),
+        tzinfo=_NY_TZ).timestamp()
     
-    return start <= current_time <= end
+    return (_epoch(SESSION_START), _epoch(OR_LOCK_TIME),
+            _epoch(SESSION_END), next_day)
 
 
 def setup_logging():
@@ -59,15 +98,21 @@ def setup_logging():
     # Remove existing handlers
     logger.handlers = []
     
-    # File handler
-    file_handler = logging.FileHandler(LOG_FILE)
+    # File handler: buffer records in memory so tick-path logging does
+    # not pay a write syscall per record; the buffer drains to the file
+    # when full or as soon as a WARNING or worse arrives. delay=True
+    # defers opening the log file until the first flush.
+    file_handler = logging.FileHandler(LOG_FILE, delay=True)
     file_handler.setLevel(getattr(logging, LOG_LEVEL))
     file_format = logging.Formatter(
         '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_format)
-    logger.addHandler(file_handler)
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=1024, flushLevel=logging.WARNING, target=file_handler)
+    memory_handler.setLevel(getattr(logging, LOG_LEVEL))
+    logger.addHandler(memory_handler)
     
     # Console handler
     console_handler = logging.StreamHandler()
@@ -129,15 +174,16 @@ def time_until_next_session():
     
     # If before 09:30 today, return time until 09:30 today
     session_start = ny_time.replace(hour=9, minute=30, second=0, microsecond=0)
-    if ny_time.time() < datetime.time(9, 30):
+    if ny_time.time() < _SESSION_START:
         return session_start - ny_time
     
     # Otherwise, return time until 09:30 tomorrow
     next_day = ny_time + datetime.timedelta(days=1)
     next_session = next_day.replace(hour=9, minute=30, second=0, microsecond=0)
     
-    # Skip weekends
-    while next_session.weekday() >= 5:
-        next_session += datetime.timedelta(days=1)
+    # Skip weekends: Saturday jumps 2 days to Monday, Sunday jumps 1
+    skip = (0, 0, 0, 0, 0, 2, 1)[next_session.weekday()]
+    if skip:
+        next_session += datetime.timedelta(days=skip)
     
     return next_session - ny_time